@@ -0,0 +1,53 @@
+"""Add composite indexes for analytics query paths
+
+Revision ID: 0003_analytics_indexes
+Revises: 0002_add_teachers
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_analytics_indexes'
+down_revision: Union[str, None] = '0002_add_teachers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Analytics period scans filter on (status, started_at); the existing
+    # single-column indexes cannot serve both predicates together.
+    op.create_index(
+        'ix_oracy_sessions_status_started_at',
+        'oracy_sessions',
+        ['status', 'started_at'],
+    )
+
+    # Per-student session history for struggling-student detection.
+    op.create_index(
+        'ix_oracy_sessions_student_started_at',
+        'oracy_sessions',
+        ['student_id', 'started_at'],
+    )
+
+    # School filters join through students; school_code was never indexed.
+    op.create_index('ix_students_school_code', 'students', ['school_code'])
+
+    # Pending-review count only ever looks at unreviewed reports, so a
+    # partial index keeps it tiny regardless of report history size.
+    op.create_index(
+        'ix_scout_reports_pending_review',
+        'scout_reports',
+        ['created_at'],
+        postgresql_where=sa.text('is_reviewed = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scout_reports_pending_review', table_name='scout_reports')
+    op.drop_index('ix_students_school_code', table_name='students')
+    op.drop_index('ix_oracy_sessions_student_started_at', table_name='oracy_sessions')
+    op.drop_index('ix_oracy_sessions_status_started_at', table_name='oracy_sessions')
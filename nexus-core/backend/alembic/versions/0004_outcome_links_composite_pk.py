@@ -0,0 +1,49 @@
+"""Replace outcome_links surrogate PK with composite key
+
+Revision ID: 0004_outcome_links_composite_pk
+Revises: 0003_analytics_indexes
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_outcome_links_composite_pk'
+down_revision: Union[str, None] = '0003_analytics_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The junction table never needs its own identity: a session links to an
+    # outcome at most once. Making (oracy_session_id, curriculum_outcome_id)
+    # the primary key gives us the session-side lookup index for free and
+    # lets us drop both the uuid column and the now-redundant btree on
+    # oracy_session_id. The outcome-side index stays for reverse lookups.
+    op.drop_index('ix_outcome_links_session', table_name='outcome_links')
+    op.drop_constraint('outcome_links_pkey', 'outcome_links', type_='primary')
+    op.drop_column('outcome_links', 'id')
+    op.create_primary_key(
+        'outcome_links_pkey',
+        'outcome_links',
+        ['oracy_session_id', 'curriculum_outcome_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('outcome_links_pkey', 'outcome_links', type_='primary')
+    op.add_column(
+        'outcome_links',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text('gen_random_uuid()'),
+        ),
+    )
+    op.create_primary_key('outcome_links_pkey', 'outcome_links', ['id'])
+    op.create_index('ix_outcome_links_session', 'outcome_links', ['oracy_session_id'])
@@ -0,0 +1,46 @@
+"""Store curriculum outcome embeddings as pgvector
+
+Revision ID: 0005_pgvector_embeddings
+Revises: 0004_outcome_links_composite_pk
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_pgvector_embeddings'
+down_revision: Union[str, None] = '0004_outcome_links_composite_pk'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dimensionality of text-embedding-3-small / ada-002 vectors.
+EMBEDDING_DIM = 1536
+
+
+def upgrade() -> None:
+    # float8[] supports no similarity search: every query would scan and
+    # re-score all rows in Python. pgvector's vector type gives us
+    # SIMD-backed distance operators and ANN indexing in the database.
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.execute(
+        f'ALTER TABLE curriculum_outcomes '
+        f'ALTER COLUMN embedding TYPE vector({EMBEDDING_DIM}) '
+        f'USING embedding::vector({EMBEDDING_DIM})'
+    )
+    # HNSW over cosine distance; the outcome corpus is small enough that
+    # default build parameters are fine.
+    op.execute(
+        'CREATE INDEX ix_curriculum_outcomes_embedding '
+        'ON curriculum_outcomes USING hnsw (embedding vector_cosine_ops)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX ix_curriculum_outcomes_embedding')
+    op.execute(
+        'ALTER TABLE curriculum_outcomes '
+        'ALTER COLUMN embedding TYPE float8[] '
+        'USING embedding::float8[]'
+    )
@@ -0,0 +1,45 @@
+"""Add monotonic bigint identity columns to high-write tables
+
+Revision ID: 0006_bigint_seq_ids
+Revises: 0005_pgvector_embeddings
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_bigint_seq_ids'
+down_revision: Union[str, None] = '0005_pgvector_embeddings'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Random uuid PKs land every insert in a random btree leaf page, churning
+# WAL and shared_buffers on the write-heavy tables. These identity columns
+# give each row a monotonic internal key whose index grows append-only.
+# The uuid ids stay as the primary key for now: they are threaded through
+# the app layer (session ids travel over the WebSocket protocol and REST
+# URLs), so promoting seq_id to PK and demoting uuid to an external
+# surrogate is staged behind this additive step.
+HIGH_WRITE_TABLES = ('oracy_sessions', 'scout_reports')
+
+
+def upgrade() -> None:
+    for table in HIGH_WRITE_TABLES:
+        op.execute(
+            f'ALTER TABLE {table} '
+            f'ADD COLUMN seq_id bigint GENERATED ALWAYS AS IDENTITY'
+        )
+        op.create_index(
+            f'ix_{table}_seq_id',
+            table,
+            ['seq_id'],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(HIGH_WRITE_TABLES):
+        op.drop_index(f'ix_{table}_seq_id', table_name=table)
+        op.drop_column(table, 'seq_id')
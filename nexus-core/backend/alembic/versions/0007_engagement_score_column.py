@@ -0,0 +1,41 @@
+"""Add generated engagement_score column to scout_reports
+
+Revision ID: 0007_engagement_score_column
+Revises: 0006_bigint_seq_ids
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_engagement_score_column'
+down_revision: Union[str, None] = '0006_bigint_seq_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Analytics queries kept re-evaluating the same enum-to-score CASE per
+    # row; storing it once per report turns averages into plain float
+    # column scans. lower() tolerates both enum-name and lowercase string
+    # storage of engagement_level.
+    op.execute(
+        "ALTER TABLE scout_reports "
+        "ADD COLUMN engagement_score real GENERATED ALWAYS AS ("
+        "CASE lower(engagement_level::text) "
+        "WHEN 'high' THEN 1.0 WHEN 'medium' THEN 0.5 ELSE 0.0 END"
+        ") STORED"
+    )
+    # Covering index so time-windowed engagement averages can be served by
+    # index-only scans.
+    op.execute(
+        'CREATE INDEX ix_scout_reports_engscore_created '
+        'ON scout_reports (created_at) INCLUDE (engagement_score)'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX ix_scout_reports_engscore_created')
+    op.drop_column('scout_reports', 'engagement_score')
@@ -0,0 +1,61 @@
+"""Deduplicate teacher indexes; case-insensitive email uniqueness
+
+Revision ID: 0008_teachers_index_dedup
+Revises: 0007_engagement_score_column
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_teachers_index_dedup'
+down_revision: Union[str, None] = '0007_engagement_score_column'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The UNIQUE constraints already maintain btrees on email and
+    # teacher_code; the explicit indexes from 0002 duplicated them, so
+    # every teacher insert was maintaining two identical btrees per column.
+    op.drop_index('ix_teachers_email', table_name='teachers')
+    op.drop_index('ix_teachers_teacher_code', table_name='teachers')
+
+    # Emails are matched case-insensitively at login; a unique index over
+    # lower(email) enforces that in one btree. The app layer stores
+    # lowercased email and queries with a lower(email) predicate — a
+    # plain email = $1 predicate cannot be served by an expression
+    # index — so lookups stay index scans.
+    #
+    # Existing rows must be normalized too — the app now queries with
+    # lower(email), so a stored 'Jane@School.ca' would be unreachable.
+    # Guard against case-insensitive duplicates first: lowering them (or
+    # letting the unique index build hit them) would abort mid-migration
+    # with an opaque error, so fail up front with the offending addresses.
+    conn = op.get_bind()
+    duplicates = conn.execute(
+        sa.text(
+            "SELECT lower(email) AS email, count(*) AS n FROM teachers "
+            "GROUP BY lower(email) HAVING count(*) > 1"
+        )
+    ).fetchall()
+    if duplicates:
+        collisions = ", ".join(f"{row.email} (x{row.n})" for row in duplicates)
+        raise RuntimeError(
+            "Cannot enforce case-insensitive email uniqueness; resolve "
+            f"duplicate teacher emails first: {collisions}"
+        )
+    op.execute("UPDATE teachers SET email = lower(email) WHERE email <> lower(email)")
+
+    op.drop_constraint('teachers_email_key', 'teachers', type_='unique')
+    op.execute('CREATE UNIQUE INDEX ix_teachers_email_lower ON teachers (lower(email))')
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX ix_teachers_email_lower')
+    op.create_unique_constraint('teachers_email_key', 'teachers', ['email'])
+    op.create_index('ix_teachers_teacher_code', 'teachers', ['teacher_code'])
+    op.create_index('ix_teachers_email', 'teachers', ['email'])
@@ -0,0 +1,97 @@
+"""Add daily engagement rollup table with write-time trigger
+
+Revision ID: 0009_daily_engagement_rollup
+Revises: 0008_teachers_index_dedup
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_daily_engagement_rollup'
+down_revision: Union[str, None] = '0008_teachers_index_dedup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Dashboard endpoints were re-aggregating the sessions/reports join on
+    # every request; this rollup keeps one row per (day, student, level),
+    # maintained by the trigger below, so trend queries scale with
+    # days x students instead of total session volume.
+    op.create_table(
+        'daily_engagement_stats',
+        sa.Column('stat_date', sa.Date(), nullable=False),
+        sa.Column('student_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('engagement_level', sa.String(20), nullable=False),
+        sa.Column('school_code', sa.String(32), nullable=True),
+        sa.Column('session_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('duration_sum', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('stat_date', 'student_id', 'engagement_level'),
+    )
+    op.create_index(
+        'ix_daily_engagement_school_date',
+        'daily_engagement_stats',
+        ['school_code', 'stat_date'],
+    )
+
+    # Write-time maintenance: every scout report upserts its session's
+    # daily bucket.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION nexus_rollup_daily_engagement() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO daily_engagement_stats
+                (stat_date, student_id, engagement_level, school_code,
+                 session_count, duration_sum)
+            SELECT date(o.started_at), o.student_id, NEW.engagement_level,
+                   s.school_code, 1, COALESCE(o.duration_seconds, 0)
+            FROM oracy_sessions o
+            JOIN students s ON s.id = o.student_id
+            WHERE o.id = NEW.oracy_session_id
+            ON CONFLICT (stat_date, student_id, engagement_level)
+            DO UPDATE SET
+                session_count = daily_engagement_stats.session_count + 1,
+                duration_sum = daily_engagement_stats.duration_sum
+                    + EXCLUDED.duration_sum;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_rollup_daily_engagement
+        AFTER INSERT ON scout_reports
+        FOR EACH ROW EXECUTE FUNCTION nexus_rollup_daily_engagement()
+        """
+    )
+
+    # Backfill from existing reports so the rollup is immediately usable.
+    op.execute(
+        """
+        INSERT INTO daily_engagement_stats
+            (stat_date, student_id, engagement_level, school_code,
+             session_count, duration_sum)
+        SELECT date(o.started_at), o.student_id, r.engagement_level,
+               s.school_code, COUNT(*), COALESCE(SUM(o.duration_seconds), 0)
+        FROM scout_reports r
+        JOIN oracy_sessions o ON o.id = r.oracy_session_id
+        JOIN students s ON s.id = o.student_id
+        GROUP BY date(o.started_at), o.student_id, r.engagement_level,
+                 s.school_code
+        ON CONFLICT (stat_date, student_id, engagement_level) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER trg_rollup_daily_engagement ON scout_reports')
+    op.execute('DROP FUNCTION nexus_rollup_daily_engagement()')
+    op.drop_index('ix_daily_engagement_school_date', table_name='daily_engagement_stats')
+    op.drop_table('daily_engagement_stats')
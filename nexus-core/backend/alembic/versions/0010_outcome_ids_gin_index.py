@@ -0,0 +1,32 @@
+"""GIN-index session outcome ids for containment lookups
+
+Revision ID: 0010_outcome_ids_gin_index
+Revises: 0009_daily_engagement_rollup
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_outcome_ids_gin_index'
+down_revision: Union[str, None] = '0009_daily_engagement_rollup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Coverage queries matched outcome ids with LIKE '%id%' over the
+    # comma-separated column — an unindexable substring scan per outcome.
+    # A GIN expression index over the split array serves
+    # string_to_array(curriculum_outcome_ids, ',') @> ARRAY[:id]
+    # with an index probe and exact element matching.
+    op.execute(
+        "CREATE INDEX ix_oracy_sessions_outcome_ids_gin "
+        "ON oracy_sessions USING gin (string_to_array(curriculum_outcome_ids, ','))"
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX ix_oracy_sessions_outcome_ids_gin')
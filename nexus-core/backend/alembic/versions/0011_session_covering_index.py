@@ -0,0 +1,33 @@
+"""Add covering index for session period scans
+
+Revision ID: 0011_session_covering_index
+Revises: 0010_outcome_ids_gin_index
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0011_session_covering_index'
+down_revision: Union[str, None] = '0010_outcome_ids_gin_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The overview window queries filter started_at >= cutoff, check the
+    # status and count distinct student_id; with all three columns in one
+    # index the whole aggregate is an index-only scan.
+    op.create_index(
+        'ix_oracy_sessions_started_status_student',
+        'oracy_sessions',
+        ['started_at', 'status', 'student_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_oracy_sessions_started_status_student', table_name='oracy_sessions'
+    )
@@ -0,0 +1,34 @@
+"""Add generated started_on day column to oracy_sessions
+
+Revision ID: 0012_session_started_on_column
+Revises: 0011_session_covering_index
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0012_session_started_on_column'
+down_revision: Union[str, None] = '0011_session_covering_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Day-bucketed queries were grouping on date(started_at) computed per
+    # row per query. Storing the UTC day once makes the GROUP BY a plain
+    # indexed column scan. The explicit AT TIME ZONE keeps the expression
+    # immutable, as generated columns require.
+    op.execute(
+        "ALTER TABLE oracy_sessions "
+        "ADD COLUMN started_on date GENERATED ALWAYS AS "
+        "((started_at AT TIME ZONE 'UTC')::date) STORED"
+    )
+    op.create_index('ix_oracy_sessions_started_on', 'oracy_sessions', ['started_on'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_oracy_sessions_started_on', table_name='oracy_sessions')
+    op.drop_column('oracy_sessions', 'started_on')
@@ -0,0 +1,44 @@
+"""Add composite indexes for report list filters
+
+Revision ID: 0013_report_list_indexes
+Revises: 0012_session_started_on_column
+Create Date: 2025-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0013_report_list_indexes'
+down_revision: Union[str, None] = '0012_session_started_on_column'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # list_scout_reports filters on teacher_id / is_reviewed /
+    # engagement_level and orders by created_at DESC; pairing each filter
+    # column with created_at serves every filtered page as an index range
+    # scan in sort order.
+    op.create_index(
+        'ix_scout_reports_teacher_created',
+        'scout_reports',
+        ['teacher_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_scout_reports_review_created',
+        'scout_reports',
+        ['is_reviewed', 'created_at'],
+    )
+    op.create_index(
+        'ix_scout_reports_engagement_created',
+        'scout_reports',
+        ['engagement_level', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scout_reports_engagement_created', table_name='scout_reports')
+    op.drop_index('ix_scout_reports_review_created', table_name='scout_reports')
+    op.drop_index('ix_scout_reports_teacher_created', table_name='scout_reports')
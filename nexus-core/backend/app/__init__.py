@@ -1,5 +1,19 @@
 """NEXUS Backend Application."""
 
-from app.main import app
+from typing import Any
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily expose the FastAPI app (PEP 562).
+
+    Importing subpackages (app.core.config from scripts, alembic, tests)
+    must not construct the entire application as a side effect.
+    """
+    if name == "app":
+        from app.main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
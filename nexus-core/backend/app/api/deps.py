@@ -1,81 +1,161 @@
 """API dependencies for FastAPI routes."""
 
-from collections.abc import AsyncGenerator
+import time
 from typing import Annotated
 
+import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.core.config import settings
-from app.core.database import async_session_factory
+from app.core.database import get_db
 from app.db.models import Teacher, UserRole
 
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
+# Verification material resolved once at import; settings are fixed for
+# the process lifetime and this runs on every authenticated request.
+JWT_SECRET = settings.jwt_secret
+JWT_ALGORITHMS = [settings.jwt_algorithm]
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# Verified-token cache: raw bearer token -> (teacher_code, exp unix timestamp).
+# Clients resend the same bearer token on every request, so re-running the
+# HMAC verification each time is pure CPU overhead on the hot auth path.
+# A token that verified once stays valid until its exp claim, so we can skip
+# signature verification entirely for repeat tokens.
+_TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: dict[str, tuple[str, float]] = {}
+
+
+def _verify_token(token: str) -> str | None:
     """
-    Dependency that provides a database session.
+    Verify a JWT and return its subject (teacher_code), or None if invalid.
 
-    Handles commit/rollback and cleanup automatically.
+    Uses a bounded in-process cache so repeated requests with the same
+    bearer token skip signature verification until the token expires.
     """
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
-
-
-# Type alias for database dependency
+    now = time.time()
+
+    cached = _token_cache.get(token)
+    if cached is not None:
+        teacher_code, exp = cached
+        if now < exp:
+            return teacher_code
+        del _token_cache[token]
+
+    try:
+        payload = jwt.decode(token, JWT_SECRET, algorithms=JWT_ALGORITHMS)
+    except jwt.InvalidTokenError:
+        return None
+
+    teacher_code = payload.get("sub")
+    exp = payload.get("exp")
+    if teacher_code is None:
+        return None
+
+    if exp is not None:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+            # Evict expired entries; flush entirely if still full.
+            expired = [t for t, (_, e) in _token_cache.items() if e <= now]
+            for t in expired:
+                del _token_cache[t]
+            if len(_token_cache) >= _TOKEN_CACHE_MAX_SIZE:
+                _token_cache.clear()
+        _token_cache[token] = (teacher_code, float(exp))
+
+    return teacher_code
+
+
+# Teacher lookup cache: teacher_code -> (detached Teacher, monotonic deadline).
+# The JWT already authenticates the subject, so re-running
+# SELECT * FROM teachers on every authenticated request is an unnecessary
+# round-trip and a source of pool contention under load. Cached instances are
+# detached (expire_on_commit=False keeps their attributes readable); any
+# endpoint that mutates a teacher row must merge it into its own session and
+# call invalidate_teacher_cache() afterwards.
+_TEACHER_CACHE_TTL_SECONDS = 60.0
+_TEACHER_CACHE_MAX_SIZE = 1024
+_teacher_cache: dict[str, tuple[Teacher, float]] = {}
+
+
+def invalidate_teacher_cache(teacher_code: str) -> None:
+    """Drop a teacher from the lookup cache after their row is modified."""
+    _teacher_cache.pop(teacher_code, None)
+
+
+# Type alias for database dependency (get_db is re-exported from
+# app.core.database so both import paths share one implementation)
 DBSession = Annotated[AsyncSession, Depends(get_db)]
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db: DBSession,
+async def _resolve_current_user(
+    credentials: HTTPAuthorizationCredentials | None,
+    db: AsyncSession,
 ) -> Teacher | None:
     """
-    Decode JWT token and return the current authenticated user.
+    Decode the bearer token and load its teacher, or None if invalid.
 
-    Returns None if no valid credentials are provided.
+    Shared by the auth dependencies below so each stays a single
+    dependency node instead of chaining through Depends(get_current_user);
+    every extra node in the chain costs a coroutine frame and a dependency
+    cache lookup per request.
     """
     if not credentials:
         return None
 
-    try:
-        payload = jwt.decode(
-            credentials.credentials,
-            settings.jwt_secret,
-            algorithms=[settings.jwt_algorithm],
-        )
-        teacher_code: str = payload.get("sub")
-        if teacher_code is None:
-            return None
-    except JWTError:
+    teacher_code = _verify_token(credentials.credentials)
+    if teacher_code is None:
         return None
 
+    now = time.monotonic()
+    cached = _teacher_cache.get(teacher_code)
+    if cached is not None:
+        teacher, deadline = cached
+        if now < deadline:
+            return teacher
+        del _teacher_cache[teacher_code]
+
+    # raiseload: the auth path must only touch column attributes — cached
+    # instances are served detached, where a lazy load would fail anyway.
     result = await db.execute(
-        select(Teacher).where(Teacher.teacher_code == teacher_code)
+        select(Teacher)
+        .where(Teacher.teacher_code == teacher_code)
+        .options(raiseload("*"))
     )
-    return result.scalar_one_or_none()
+    teacher = result.scalar_one_or_none()
+    if teacher is not None:
+        if len(_teacher_cache) >= _TEACHER_CACHE_MAX_SIZE:
+            _teacher_cache.clear()
+        _teacher_cache[teacher_code] = (teacher, now + _TEACHER_CACHE_TTL_SECONDS)
+    return teacher
+
+
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    db: DBSession,
+) -> Teacher | None:
+    """
+    Decode JWT token and return the current authenticated user.
+
+    Returns None if no valid credentials are provided.
+    """
+    return await _resolve_current_user(credentials, db)
 
 
 async def require_auth(
-    current_user: Annotated[Teacher | None, Depends(get_current_user)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    db: DBSession,
 ) -> Teacher:
     """
     Dependency that requires authentication.
 
     Raises 401 if user is not authenticated.
     """
+    current_user = await _resolve_current_user(credentials, db)
     if current_user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -86,13 +166,21 @@ async def require_auth(
 
 
 async def require_admin(
-    current_user: Annotated[Teacher, Depends(require_auth)],
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
+    db: DBSession,
 ) -> Teacher:
     """
     Dependency that requires admin role.
 
-    Raises 403 if user is not an admin.
+    Raises 401 if unauthenticated, 403 if not an admin.
     """
+    current_user = await _resolve_current_user(credentials, db)
+    if current_user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
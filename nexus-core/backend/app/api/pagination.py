@@ -0,0 +1,34 @@
+"""
+Cursor (keyset) pagination helpers for list endpoints.
+
+OFFSET pagination makes the database scan and discard
+(page - 1) * page_size rows per request and shifts under concurrent
+writes. List endpoints instead hand clients an opaque cursor encoding
+the (sort timestamp, id) of the last row served; the next page resumes
+with a tuple-comparison index seek.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Encode a page boundary into an opaque cursor string."""
+    payload = json.dumps([sort_value.isoformat(), row_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor back into its (sort timestamp, id) boundary.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except (binascii.Error, json.JSONDecodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
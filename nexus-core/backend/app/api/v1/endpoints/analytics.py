@@ -7,17 +7,25 @@ Provides cohort-level insights for teachers:
 - Curriculum coverage heatmaps
 """
 
-from datetime import datetime, timedelta
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel, Field
-from sqlalchemy import case, distinct, func, select
+import asyncio
+import hashlib
+from contextvars import ContextVar
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import Text, bindparam, case, distinct, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.core.cache import TTLCache
+from app.core.database import async_session_factory
 from app.db.models import (
     CurriculumOutcome,
+    DailyEngagementStat,
     EngagementLevel,
     OracySession,
     ScoutReport,
@@ -25,7 +33,77 @@ from app.db.models import (
     Student,
 )
 
-router = APIRouter(prefix="/analytics", tags=["analytics"])
+# === Response Caching ===
+
+# Analytics responses only change when a session ends or a report is
+# written/reviewed, so dashboard refreshes can be answered with 304s.
+# The dataset version is derived from cheap indexed aggregates.
+ANALYTICS_VERSION_STMT = select(
+    select(func.count(ScoutReport.id)).scalar_subquery().label("report_count"),
+    select(func.max(ScoutReport.created_at)).scalar_subquery().label("last_report_at"),
+    select(func.max(OracySession.ended_at)).scalar_subquery().label("last_session_end"),
+    # Session starts change active_students_this_week as soon as the row
+    # is inserted at websocket connect, before any report or session end
+    # exists; track them explicitly.
+    select(func.max(OracySession.started_at)).scalar_subquery().label("last_session_start"),
+    # Review-state flips change the pending-review metric without touching
+    # any of the columns above; count them into the version too.
+    select(func.count(ScoutReport.id))
+    .where(ScoutReport.is_reviewed == False)  # noqa: E712
+    .scalar_subquery()
+    .label("pending_count"),
+    # Student rows feed total_students, the school_code filters and the
+    # grade/language fields in struggling-students; track creations,
+    # deletions and updates (updated_at moves on every student PATCH).
+    select(func.count(Student.id)).scalar_subquery().label("student_count"),
+    select(func.max(Student.updated_at)).scalar_subquery().label("last_student_update"),
+)
+
+CACHE_CONTROL_HEADER = "private, max-age=0, must-revalidate"
+
+# Dataset version for the current request, set by analytics_cache_headers
+# and read by the response caches below so a body cached under version V
+# is never served with a newer ETag. A ContextVar (rather than
+# request.state) also reaches the summary endpoint's gathered sub-calls,
+# which run without a Request but inherit the task context.
+_analytics_version: ContextVar[str | None] = ContextVar(
+    "_analytics_version", default=None
+)
+
+
+async def analytics_cache_headers(
+    request: Request,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> None:
+    """
+    Router-level dependency adding ETag revalidation to analytics responses.
+
+    Short-circuits with 304 when the client's If-None-Match still matches
+    the current dataset version, skipping the aggregate queries entirely.
+    """
+    version = (await db.execute(ANALYTICS_VERSION_STMT)).first()
+    etag = f'W/"{hashlib.md5(repr(tuple(version)).encode()).hexdigest()}"'
+    _analytics_version.set(etag)
+
+    if request.headers.get("if-none-match") == etag:
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": CACHE_CONTROL_HEADER},
+        )
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL_HEADER
+
+
+# Analytics payloads are the largest JSON bodies we serve (per-day trend
+# arrays, per-outcome coverage lists); orjson serializes them in C.
+router = APIRouter(
+    prefix="/analytics",
+    tags=["analytics"],
+    default_response_class=ORJSONResponse,
+    dependencies=[Depends(analytics_cache_headers)],
+)
 
 
 # === Pydantic Schemas ===
@@ -34,6 +112,10 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
 class EngagementTrendPoint(BaseModel):
     """Single data point in engagement trend."""
 
+    # Constructed per query row; frozen enables pydantic's immutable fast
+    # paths and the rows are built once from already-typed DB values.
+    model_config = ConfigDict(frozen=True)
+
     date: str  # YYYY-MM-DD format
     high_engagement_count: int
     medium_engagement_count: int
@@ -45,6 +127,8 @@ class EngagementTrendPoint(BaseModel):
 class EngagementTrendResponse(BaseModel):
     """Engagement trends over time."""
 
+    model_config = ConfigDict(frozen=True)
+
     period_start: datetime
     period_end: datetime
     trend_data: list[EngagementTrendPoint]
@@ -56,6 +140,8 @@ class EngagementTrendResponse(BaseModel):
 class StrugglingStudentAlert(BaseModel):
     """Alert for students showing low engagement patterns."""
 
+    model_config = ConfigDict(frozen=True)
+
     student_code: str
     grade: int
     primary_language: str
@@ -76,6 +162,8 @@ class StrugglingStudentsResponse(BaseModel):
 class CurriculumCoverageItem(BaseModel):
     """Coverage data for a single curriculum outcome."""
 
+    model_config = ConfigDict(frozen=True)
+
     outcome_id: str
     outcome_code: str
     outcome_description: str
@@ -100,6 +188,8 @@ class CurriculumCoverageResponse(BaseModel):
 class ClassOverviewStats(BaseModel):
     """Quick stats for class overview."""
 
+    model_config = ConfigDict(frozen=True)
+
     total_students: int
     active_students_this_week: int
     total_sessions_this_week: int
@@ -120,14 +210,98 @@ class AnalyticsSummaryResponse(BaseModel):
 
 # === Helper Functions ===
 
+# Built once at import; calculate_engagement_score is called per row in
+# aggregation loops, so rebuilding the mapping on every call is wasted work.
+ENGAGEMENT_SCORES: dict[EngagementLevel, float] = {
+    EngagementLevel.LOW: 0.0,
+    EngagementLevel.MEDIUM: 0.5,
+    EngagementLevel.HIGH: 1.0,
+}
+
 
 def calculate_engagement_score(level: EngagementLevel) -> float:
     """Convert engagement level to numeric score."""
-    return {
-        EngagementLevel.LOW: 0.0,
-        EngagementLevel.MEDIUM: 0.5,
-        EngagementLevel.HIGH: 1.0,
-    }.get(level, 0.5)
+    return ENGAGEMENT_SCORES.get(level, 0.5)
+
+
+# === Precompiled Statements ===
+
+
+def _build_overview_stmt(school_code: str | None) -> Any:
+    """
+    Build the class-overview statement: one row, every metric a scalar
+    subquery, so the dashboard header costs a single round-trip instead
+    of five sequential queries sharing the same cutoff.
+    """
+    cutoff = bindparam("cutoff")
+    session_window = (
+        OracySession.started_at >= cutoff,
+        OracySession.status == SessionStatus.COMPLETED,
+    )
+
+    total_students = select(func.count(Student.id))
+    if school_code is not None:
+        total_students = total_students.where(
+            Student.school_code == bindparam("school_code")
+        )
+
+    return select(
+        total_students.scalar_subquery().label("total_students"),
+        select(func.count(distinct(OracySession.student_id)))
+        .where(OracySession.started_at >= cutoff)
+        .scalar_subquery()
+        .label("active_students"),
+        select(func.count(OracySession.id))
+        .where(*session_window)
+        .scalar_subquery()
+        .label("total_sessions"),
+        select(func.avg(OracySession.duration_seconds))
+        .where(*session_window)
+        .scalar_subquery()
+        .label("avg_duration"),
+        select(func.sum(OracySession.duration_seconds))
+        .where(*session_window)
+        .scalar_subquery()
+        .label("total_duration"),
+        select(func.count(ScoutReport.id))
+        .select_from(ScoutReport)
+        .join(OracySession)
+        .where(OracySession.started_at >= cutoff)
+        .scalar_subquery()
+        .label("total_reports"),
+        select(func.count(ScoutReport.id))
+        .select_from(ScoutReport)
+        .join(OracySession)
+        .where(
+            OracySession.started_at >= cutoff,
+            ScoutReport.engagement_level == EngagementLevel.HIGH,
+        )
+        .scalar_subquery()
+        .label("high_reports"),
+        select(func.count(ScoutReport.id))
+        .where(ScoutReport.is_reviewed == False)  # noqa: E712
+        .scalar_subquery()
+        .label("pending_reviews"),
+    )
+
+
+# Precompiled for the common unfiltered dashboard; the school-filtered
+# variant is built on demand.
+OVERVIEW_STMT = _build_overview_stmt(None)
+
+# Short-lived response caches keyed by (school_code, days, dataset
+# version). The version term keeps cache and ETag coherent: without it, a
+# body cached just before a data change would be served under the
+# post-change ETag, and clients revalidating against that ETag would
+# receive 304s until the next unrelated change. Thirty seconds absorbs a
+# classroom of teachers refreshing dashboards; frozen response models
+# make the shared instances safe to hand out.
+_overview_cache: TTLCache[tuple[str | None, int, str | None], ClassOverviewStats] = (
+    TTLCache(ttl_seconds=30.0, max_size=256)
+)
+_trend_cache: TTLCache[
+    tuple[str | None, int, str | None], EngagementTrendResponse
+] = TTLCache(ttl_seconds=30.0, max_size=256)
 
 
 # === Endpoints ===
@@ -144,84 +318,39 @@ async def get_class_overview(
 
     Returns key metrics for teacher dashboard header.
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    cache_key = (school_code, days, _analytics_version.get())
+    cached = _overview_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # Base query for students
-    student_query = select(Student)
-    if school_code:
-        student_query = student_query.where(Student.school_code == school_code)
+    cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
-    # Total students
-    total_students_result = await db.execute(
-        select(func.count(Student.id)).select_from(student_query.subquery())
-    )
-    total_students = total_students_result.scalar() or 0
-
-    # Sessions in period
-    session_query = (
-        select(OracySession)
-        .where(OracySession.started_at >= cutoff_date)
-        .where(OracySession.status == SessionStatus.COMPLETED)
-    )
     if school_code:
-        session_query = session_query.join(Student).where(Student.school_code == school_code)
-
-    # Active students this week
-    active_students_result = await db.execute(
-        select(func.count(distinct(OracySession.student_id))).where(
-            OracySession.started_at >= cutoff_date
-        )
-    )
-    active_students = active_students_result.scalar() or 0
-
-    # Session stats
-    session_stats_result = await db.execute(
-        select(
-            func.count(OracySession.id).label("total_sessions"),
-            func.avg(OracySession.duration_seconds).label("avg_duration"),
-            func.sum(OracySession.duration_seconds).label("total_duration"),
-        ).where(
-            OracySession.started_at >= cutoff_date,
-            OracySession.status == SessionStatus.COMPLETED,
-        )
-    )
-    session_stats = session_stats_result.first()
-
-    total_sessions = session_stats.total_sessions if session_stats else 0
-    avg_duration = (session_stats.avg_duration or 0) / 60 if session_stats else 0
-    total_duration = (session_stats.total_duration or 0) / 60 if session_stats else 0
-
-    # High engagement rate
-    engagement_result = await db.execute(
-        select(
-            func.count(ScoutReport.id).label("total"),
-            func.sum(
-                case((ScoutReport.engagement_level == EngagementLevel.HIGH, 1), else_=0)
-            ).label("high_count"),
-        )
-        .join(OracySession)
-        .where(OracySession.started_at >= cutoff_date)
-    )
-    engagement_stats = engagement_result.first()
-    high_rate = 0.0
-    if engagement_stats and engagement_stats.total:
-        high_rate = (engagement_stats.high_count or 0) / engagement_stats.total
-
-    # Pending reviews
-    pending_result = await db.execute(
-        select(func.count(ScoutReport.id)).where(ScoutReport.is_reviewed == False)  # noqa: E712
+        stmt = _build_overview_stmt(school_code)
+        params: dict[str, Any] = {"cutoff": cutoff_date, "school_code": school_code}
+    else:
+        stmt = OVERVIEW_STMT
+        params = {"cutoff": cutoff_date}
+
+    stats = (await db.execute(stmt, params)).first()
+
+    avg_duration = (stats.avg_duration or 0) / 60
+    total_duration = (stats.total_duration or 0) / 60
+    high_rate = (
+        (stats.high_reports or 0) / stats.total_reports if stats.total_reports else 0.0
     )
-    pending_reviews = pending_result.scalar() or 0
 
-    return ClassOverviewStats(
-        total_students=total_students,
-        active_students_this_week=active_students,
-        total_sessions_this_week=total_sessions,
+    overview = ClassOverviewStats(
+        total_students=stats.total_students or 0,
+        active_students_this_week=stats.active_students or 0,
+        total_sessions_this_week=stats.total_sessions or 0,
         avg_session_duration_minutes=round(avg_duration, 1),
         total_practice_minutes_this_week=round(total_duration, 1),
         high_engagement_rate=round(high_rate, 2),
-        reports_pending_review=pending_reviews,
+        reports_pending_review=stats.pending_reviews or 0,
     )
+    _overview_cache.set(cache_key, overview)
+    return overview
 
 
 @router.get("/engagement-trend", response_model=EngagementTrendResponse)
@@ -235,72 +364,83 @@ async def get_engagement_trend(
 
     Returns daily breakdown of engagement levels for charting.
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
-    now = datetime.utcnow()
-
-    # Query sessions with engagement data
+    cache_key = (school_code, days, _analytics_version.get())
+    cached = _trend_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # One clock read per request; utcnow() is deprecated and returned a
+    # naive datetime that compared awkwardly against timestamptz columns.
+    now = datetime.now(UTC)
+    cutoff_date = now - timedelta(days=days)
+
+    # Read the write-time rollup (daily_engagement_stats) instead of
+    # re-aggregating the sessions/reports join: the scanned table scales
+    # with days x students, not total session volume.
+    level = DailyEngagementStat.engagement_level
+    count = DailyEngagementStat.session_count
     query = (
         select(
-            func.date(OracySession.started_at).label("session_date"),
-            ScoutReport.engagement_level,
-            func.count(OracySession.id).label("session_count"),
-            func.avg(OracySession.duration_seconds).label("avg_duration"),
-        )
-        .join(ScoutReport, OracySession.id == ScoutReport.oracy_session_id)
-        .where(
-            OracySession.started_at >= cutoff_date,
-            OracySession.status == SessionStatus.COMPLETED,
+            DailyEngagementStat.stat_date.label("session_date"),
+            func.sum(case((level == EngagementLevel.HIGH, count), else_=0)).label(
+                "high_count"
+            ),
+            func.sum(case((level == EngagementLevel.MEDIUM, count), else_=0)).label(
+                "medium_count"
+            ),
+            func.sum(case((level == EngagementLevel.LOW, count), else_=0)).label(
+                "low_count"
+            ),
+            func.sum(count).label("session_count"),
+            func.sum(DailyEngagementStat.duration_sum).label("duration_sum"),
         )
-        .group_by(func.date(OracySession.started_at), ScoutReport.engagement_level)
-        .order_by(func.date(OracySession.started_at))
+        .where(DailyEngagementStat.stat_date >= cutoff_date.date())
+        .group_by(func.rollup(DailyEngagementStat.stat_date))
+        .order_by(DailyEngagementStat.stat_date)
     )
 
     if school_code:
-        query = query.join(Student).where(Student.school_code == school_code)
+        query = query.where(DailyEngagementStat.school_code == school_code)
 
     result = await db.execute(query)
     rows = result.all()
 
-    # Process into daily data points
-    daily_data: dict[str, EngagementTrendPoint] = {}
-
+    # GROUP BY ROLLUP appends a NULL-dated grand-total row (ordered last),
+    # so the overall percentages come from the same statement instead of
+    # re-summing the day rows in Python. model_construct skips validation;
+    # every field comes straight from the typed aggregation row.
+    total = total_high = total_med = total_low = 0
+    trend_data: list[EngagementTrendPoint] = []
     for row in rows:
-        date_str = row.session_date.strftime("%Y-%m-%d")
-        if date_str not in daily_data:
-            daily_data[date_str] = EngagementTrendPoint(
-                date=date_str,
-                high_engagement_count=0,
-                medium_engagement_count=0,
-                low_engagement_count=0,
-                total_sessions=0,
-                avg_duration_minutes=0,
+        if row.session_date is None:
+            total = row.session_count
+            total_high = row.high_count
+            total_med = row.medium_count
+            total_low = row.low_count
+            continue
+        trend_data.append(
+            EngagementTrendPoint.model_construct(
+                date=row.session_date.strftime("%Y-%m-%d"),
+                high_engagement_count=row.high_count,
+                medium_engagement_count=row.medium_count,
+                low_engagement_count=row.low_count,
+                total_sessions=row.session_count,
+                avg_duration_minutes=(row.duration_sum / row.session_count / 60)
+                if row.session_count
+                else 0.0,
             )
+        )
 
-        point = daily_data[date_str]
-        point.total_sessions += row.session_count
-        point.avg_duration_minutes = (row.avg_duration or 0) / 60
-
-        if row.engagement_level == EngagementLevel.HIGH:
-            point.high_engagement_count = row.session_count
-        elif row.engagement_level == EngagementLevel.MEDIUM:
-            point.medium_engagement_count = row.session_count
-        elif row.engagement_level == EngagementLevel.LOW:
-            point.low_engagement_count = row.session_count
-
-    # Calculate overall percentages
-    total = sum(p.total_sessions for p in daily_data.values())
-    total_high = sum(p.high_engagement_count for p in daily_data.values())
-    total_med = sum(p.medium_engagement_count for p in daily_data.values())
-    total_low = sum(p.low_engagement_count for p in daily_data.values())
-
-    return EngagementTrendResponse(
+    trend = EngagementTrendResponse(
         period_start=cutoff_date,
         period_end=now,
-        trend_data=sorted(daily_data.values(), key=lambda x: x.date),
+        trend_data=trend_data,
         overall_high_percentage=round(total_high / total * 100, 1) if total else 0,
         overall_medium_percentage=round(total_med / total * 100, 1) if total else 0,
         overall_low_percentage=round(total_low / total * 100, 1) if total else 0,
     )
+    _trend_cache.set(cache_key, trend)
+    return trend
 
 
 @router.get("/struggling-students", response_model=StrugglingStudentsResponse)
@@ -315,84 +455,123 @@ async def get_struggling_students(
     Returns students with 3+ consecutive days of low engagement,
     allowing teachers to intervene early.
     """
-    alerts: list[StrugglingStudentAlert] = []
+    cutoff_date = datetime.now(UTC) - timedelta(days=14)
 
-    # Get students with their recent sessions
-    student_query = select(Student)
+    # Recent completed sessions with engagement, one CTE shared by the
+    # streak computation and the per-student stats.
+    sessions_query = (
+        select(
+            OracySession.student_id.label("student_id"),
+            OracySession.started_at.label("started_at"),
+            OracySession.duration_seconds.label("duration_seconds"),
+            ScoutReport.engagement_level.label("engagement_level"),
+            OracySession.started_on.label("day"),
+        )
+        .join(ScoutReport, OracySession.id == ScoutReport.oracy_session_id)
+        .where(
+            OracySession.started_at >= cutoff_date,
+            OracySession.status == SessionStatus.COMPLETED,
+        )
+    )
     if school_code:
-        student_query = student_query.where(Student.school_code == school_code)
+        sessions_query = sessions_query.join(
+            Student, OracySession.student_id == Student.id
+        ).where(Student.school_code == school_code)
+    sessions_cte = sessions_query.cte("recent_sessions")
 
-    students_result = await db.execute(student_query)
-    students = students_result.scalars().all()
+    # The latest session of each (student, day) decides that day's level.
+    per_day = (
+        select(
+            sessions_cte.c.student_id,
+            sessions_cte.c.day,
+            sessions_cte.c.engagement_level,
+        )
+        .distinct(sessions_cte.c.student_id, sessions_cte.c.day)
+        .order_by(
+            sessions_cte.c.student_id,
+            sessions_cte.c.day,
+            sessions_cte.c.started_at.desc(),
+        )
+        .cte("per_day")
+    )
 
-    cutoff_date = datetime.utcnow() - timedelta(days=14)
+    # Gaps-and-islands: walking days newest-first per student, break_count
+    # stays 0 until the first non-LOW day; the rows still at 0 are the
+    # student's current consecutive-LOW streak.
+    break_count = (
+        func.sum(
+            case((per_day.c.engagement_level != EngagementLevel.LOW, 1), else_=0)
+        )
+        .over(partition_by=per_day.c.student_id, order_by=per_day.c.day.desc())
+        .label("break_count")
+    )
+    flagged = select(
+        per_day.c.student_id, per_day.c.engagement_level, break_count
+    ).cte("flagged")
 
-    for student in students:
-        # Get recent sessions with engagement data
-        session_query = (
-            select(
-                OracySession.started_at,
-                OracySession.duration_seconds,
-                ScoutReport.engagement_level,
-            )
-            .join(ScoutReport, OracySession.id == ScoutReport.oracy_session_id)
-            .where(
-                OracySession.student_id == student.id,
-                OracySession.started_at >= cutoff_date,
-                OracySession.status == SessionStatus.COMPLETED,
-            )
-            .order_by(OracySession.started_at.desc())
+    streaks = (
+        select(flagged.c.student_id, func.count().label("consecutive_low"))
+        .where(
+            flagged.c.break_count == 0,
+            flagged.c.engagement_level == EngagementLevel.LOW,
         )
-        sessions_result = await db.execute(session_query)
-        sessions = sessions_result.all()
+        .group_by(flagged.c.student_id)
+        .having(func.count() >= threshold_days)
+        .cte("streaks")
+    )
 
-        if not sessions:
-            continue
+    session_stats = (
+        select(
+            sessions_cte.c.student_id,
+            func.max(sessions_cte.c.started_at).label("last_session_at"),
+            func.avg(func.coalesce(sessions_cte.c.duration_seconds, 0)).label(
+                "avg_duration"
+            ),
+        )
+        .group_by(sessions_cte.c.student_id)
+        .cte("session_stats")
+    )
 
-        # Count consecutive low engagement days
-        consecutive_low = 0
-        last_date = None
-
-        for session in sessions:
-            session_date = session.started_at.date()
-
-            # Skip if same day as last
-            if last_date == session_date:
-                continue
-
-            if session.engagement_level == EngagementLevel.LOW:
-                consecutive_low += 1
-                last_date = session_date
-            else:
-                break  # Streak broken
-
-        if consecutive_low >= threshold_days:
-            # Calculate avg duration
-            total_duration = sum(s.duration_seconds or 0 for s in sessions)
-            avg_duration = (total_duration / len(sessions) / 60) if sessions else 0
-
-            # Generate recommended action
-            if consecutive_low >= 5:
-                action = "Urgent: Schedule 1:1 check-in with student"
-            elif student.primary_language != "English":
-                action = f"Consider cultural bridge activities in {student.primary_language}"
-            else:
-                action = "Review recent Scout Reports for specific challenges"
-
-            alerts.append(
-                StrugglingStudentAlert(
-                    student_code=student.student_code,
-                    grade=student.grade,
-                    primary_language=student.primary_language,
-                    consecutive_low_engagement_days=consecutive_low,
-                    last_session_date=sessions[0].started_at if sessions else None,
-                    avg_session_duration_minutes=round(avg_duration, 1),
-                    recommended_action=action,
-                )
-            )
+    query = (
+        select(
+            Student.student_code,
+            Student.grade,
+            Student.primary_language,
+            streaks.c.consecutive_low,
+            session_stats.c.last_session_at,
+            session_stats.c.avg_duration,
+        )
+        .join_from(
+            streaks,
+            session_stats,
+            streaks.c.student_id == session_stats.c.student_id,
+        )
+        .join(Student, Student.id == streaks.c.student_id)
+        .order_by(streaks.c.consecutive_low.desc())
+    )
 
-    # Sort by severity (most consecutive days first)
-    alerts.sort(key=lambda x: x.consecutive_low_engagement_days, reverse=True)
+    rows = (await db.execute(query)).all()
+
+    alerts: list[StrugglingStudentAlert] = []
+    for row in rows:
+        if row.consecutive_low >= 5:
+            action = "Urgent: Schedule 1:1 check-in with student"
+        elif row.primary_language != "English":
+            action = f"Consider cultural bridge activities in {row.primary_language}"
+        else:
+            action = "Review recent Scout Reports for specific challenges"
+
+        alerts.append(
+            StrugglingStudentAlert.model_construct(
+                student_code=row.student_code,
+                grade=row.grade,
+                primary_language=row.primary_language,
+                consecutive_low_engagement_days=row.consecutive_low,
+                last_session_date=row.last_session_at,
+                avg_session_duration_minutes=round(float(row.avg_duration) / 60, 1),
+                recommended_action=action,
+            )
+        )
 
     return StrugglingStudentsResponse(
         alerts=alerts,
@@ -415,7 +594,7 @@ async def get_curriculum_coverage(
     Shows which Alberta Program of Studies outcomes are being practiced
     and which need more attention.
     """
-    cutoff_date = datetime.utcnow() - timedelta(days=days)
+    cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
     # Get all available curriculum outcomes
     outcomes_query = select(CurriculumOutcome)
@@ -427,54 +606,65 @@ async def get_curriculum_coverage(
     outcomes_result = await db.execute(outcomes_query)
     all_outcomes = outcomes_result.scalars().all()
 
-    # Get coverage data from sessions
-    coverage_items: list[CurriculumCoverageItem] = []
-    subjects_coverage: dict[str, int] = {}
-
-    for outcome in all_outcomes:
-        # Count sessions covering this outcome
-        session_query = (
-            select(
-                func.count(OracySession.id).label("session_count"),
-                func.count(distinct(OracySession.student_id)).label("unique_students"),
-            )
-            .join(ScoutReport, OracySession.id == ScoutReport.oracy_session_id)
-            .where(
-                OracySession.started_at >= cutoff_date,
-                OracySession.status == SessionStatus.COMPLETED,
-                OracySession.curriculum_outcome_ids.contains(outcome.id),
-            )
+    # Aggregate coverage for all outcomes in one grouped pass instead of
+    # two queries per outcome (2N round-trips). The join splits the
+    # comma-separated ids and uses array containment, which matches
+    # elements exactly and is served by the GIN expression index from
+    # migration 0010 (LIKE substring matching was unindexable and could
+    # false-positive on id prefixes).
+    session_outcome_ids = func.string_to_array(
+        OracySession.curriculum_outcome_ids, ",", type_=ARRAY(Text)
+    )
+    coverage_query = (
+        select(
+            CurriculumOutcome.id.label("outcome_id"),
+            func.count(OracySession.id).label("session_count"),
+            func.count(distinct(OracySession.student_id)).label("unique_students"),
+            func.avg(ScoutReport.engagement_score).label("avg_engagement"),
+        )
+        .select_from(CurriculumOutcome)
+        .join(
+            OracySession,
+            # Cast: curriculum_outcomes.id is uuid; the containment operand
+            # must be text[] to match both the split column and the GIN
+            # expression index (Postgres has no implicit uuid[]<->text[]).
+            session_outcome_ids.contains(array([CurriculumOutcome.id.cast(Text)])),
         )
+        .join(ScoutReport, OracySession.id == ScoutReport.oracy_session_id)
+        .where(
+            OracySession.started_at >= cutoff_date,
+            OracySession.status == SessionStatus.COMPLETED,
+        )
+        .group_by(CurriculumOutcome.id)
+    )
+    if grade is not None:
+        coverage_query = coverage_query.where(CurriculumOutcome.grade == grade)
+    if subject:
+        coverage_query = coverage_query.where(CurriculumOutcome.subject == subject)
+    if school_code:
+        coverage_query = coverage_query.join(
+            Student, OracySession.student_id == Student.id
+        ).where(Student.school_code == school_code)
 
-        if school_code:
-            session_query = session_query.join(Student).where(Student.school_code == school_code)
+    coverage_result = await db.execute(coverage_query)
+    stats_by_outcome = {row.outcome_id: row for row in coverage_result.all()}
 
-        result = await db.execute(session_query)
-        stats = result.first()
+    # Merge with the full outcome list so uncovered outcomes appear with zeros
+    coverage_items: list[CurriculumCoverageItem] = []
+    subjects_coverage: dict[str, int] = {}
 
+    for outcome in all_outcomes:
+        stats = stats_by_outcome.get(outcome.id)
         session_count = stats.session_count if stats else 0
         unique_students = stats.unique_students if stats else 0
-
-        # Get average engagement for this outcome
-        engagement_query = (
-            select(func.avg(
-                case(
-                    (ScoutReport.engagement_level == EngagementLevel.HIGH, 1.0),
-                    (ScoutReport.engagement_level == EngagementLevel.MEDIUM, 0.5),
-                    else_=0.0,
-                )
-            ))
-            .join(OracySession, ScoutReport.oracy_session_id == OracySession.id)
-            .where(
-                OracySession.started_at >= cutoff_date,
-                OracySession.curriculum_outcome_ids.contains(outcome.id),
-            )
+        avg_engagement = (
+            float(stats.avg_engagement)
+            if stats and stats.avg_engagement is not None
+            else 0.0
         )
-        engagement_result = await db.execute(engagement_query)
-        avg_engagement = engagement_result.scalar() or 0
 
         coverage_items.append(
-            CurriculumCoverageItem(
+            CurriculumCoverageItem.model_construct(
                 outcome_id=outcome.id,
                 outcome_code=outcome.outcome_code,
                 outcome_description=outcome.outcome_text,
@@ -510,19 +700,27 @@ async def get_curriculum_coverage(
 
 @router.get("/summary", response_model=AnalyticsSummaryResponse)
 async def get_analytics_summary(
-    db: Annotated[AsyncSession, Depends(get_db)],
     school_code: str | None = Query(None, description="Filter by school code"),
 ) -> AnalyticsSummaryResponse:
     """
     Get complete analytics summary for teacher dashboard.
 
     Combines all analytics data into a single response for efficient loading.
+    The four sub-reports are independent, so they run concurrently; each
+    gets its own session since an AsyncSession is not safe for concurrent
+    use. Defaults mirror each sub-endpoint's query defaults.
     """
-    # Call individual endpoints
-    overview = await get_class_overview(db, school_code)
-    engagement = await get_engagement_trend(db, school_code)
-    struggling = await get_struggling_students(db, school_code)
-    curriculum = await get_curriculum_coverage(db, school_code)
+
+    async def run(fn: Any, **kwargs: Any) -> Any:
+        async with async_session_factory() as session:
+            return await fn(session, school_code, **kwargs)
+
+    overview, engagement, struggling, curriculum = await asyncio.gather(
+        run(get_class_overview, days=7),
+        run(get_engagement_trend, days=30),
+        run(get_struggling_students, threshold_days=3),
+        run(get_curriculum_coverage, grade=None, subject=None, days=30),
+    )
 
     return AnalyticsSummaryResponse(
         overview=overview,
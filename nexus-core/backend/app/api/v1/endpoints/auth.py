@@ -4,25 +4,47 @@ Authentication API endpoints.
 Handles teacher login, registration, and token management.
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
+import jwt
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy import select
+from sqlalchemy import exists, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from app.api.deps import get_db
+from app.api.deps import get_db, invalidate_teacher_cache, require_auth
 from app.core.config import settings
 from app.db.models import Teacher, UserRole
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Signing material and token lifetime, resolved once at import: the
+# settings are fixed for the process lifetime and pydantic-settings
+# attribute access is not free on a per-login path. HS256 keys are raw
+# bytes, so there is no key object to prepare beyond this.
+JWT_SECRET = settings.jwt_secret
+JWT_ALGORITHM = settings.jwt_algorithm
+JWT_LIFETIME = timedelta(hours=settings.jwt_expiration_hours)
+JWT_EXPIRES_IN_SECONDS = settings.jwt_expiration_hours * 3600
+
+# Password hashing. argon2id (argon2-cffi, compiled C) is the primary
+# scheme; bcrypt stays registered so existing hashes keep verifying.
+# passlib's modular-crypt strings already encode algorithm, parameters,
+# salt, and digest, so password_hash remains a single column.
+# Parameters follow the OWASP argon2id baseline (19 MiB, t=2, p=1) for a
+# predictable per-login CPU/memory budget.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 
 # === Pydantic Schemas ===
@@ -84,6 +106,19 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verify a password, returning a replacement hash when the stored one
+    uses a deprecated scheme or stale parameters (e.g. legacy bcrypt).
+
+    Login endpoints persist the new hash so old credentials upgrade
+    transparently on their next successful use.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password for storage."""
     return pwd_context.hash(password)
@@ -92,21 +127,9 @@ def get_password_hash(password: str) -> str:
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
+    to_encode["exp"] = datetime.now(UTC) + (expires_delta or JWT_LIFETIME)
 
-    if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
-    else:
-        expire = datetime.now(UTC) + timedelta(hours=settings.jwt_expiration_hours)
-
-    to_encode.update({"exp": expire})
-
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.jwt_secret,
-        algorithm=settings.jwt_algorithm,
-    )
-
-    return encoded_jwt
+    return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
 # === Endpoints ===
@@ -122,31 +145,43 @@ async def register_teacher(
 
     Creates a new teacher record and returns an access token.
     """
-    # Check if email already exists
-    existing_email = await db.execute(
-        select(Teacher).where(Teacher.email == data.email)
-    )
-    if existing_email.scalar_one_or_none():
+    # Emails are stored lowercased; uniqueness is enforced case-insensitively
+    email = data.email.lower()
+
+    # Check both uniqueness constraints in one round-trip; EXISTS lets the
+    # database stop at the first match with no row materialization.
+    # lower(email) on the query side: the only email index is the
+    # expression index over lower(email), which a plain email = $1
+    # predicate cannot use.
+    taken = (
+        await db.execute(
+            select(
+                exists()
+                .where(func.lower(Teacher.email) == email)
+                .label("email_taken"),
+                exists()
+                .where(Teacher.teacher_code == data.teacher_code)
+                .label("code_taken"),
+            )
+        )
+    ).first()
+    if taken.email_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Email already registered",
         )
-
-    # Check if teacher_code already exists
-    existing_code = await db.execute(
-        select(Teacher).where(Teacher.teacher_code == data.teacher_code)
-    )
-    if existing_code.scalar_one_or_none():
+    if taken.code_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Teacher code already in use",
         )
 
-    # Create new teacher
-    hashed_password = get_password_hash(data.password)
+    # Create new teacher. Hashing is CPU-bound for hundreds of
+    # milliseconds; run it in a worker thread so the event loop stays free.
+    hashed_password = await asyncio.to_thread(get_password_hash, data.password)
 
     teacher = Teacher(
-        email=data.email,
+        email=email,
         teacher_code=data.teacher_code,
         school_code=data.school_code,
         role=UserRole.TEACHER,
@@ -165,7 +200,7 @@ async def register_teacher(
 
     return TokenResponse(
         access_token=access_token,
-        expires_in=settings.jwt_expiration_hours * 3600,
+        expires_in=JWT_EXPIRES_IN_SECONDS,
         teacher_id=teacher.id,
         teacher_code=teacher.teacher_code,
         role=teacher.role,
@@ -180,9 +215,14 @@ async def login(
     """
     Authenticate a teacher and return an access token.
     """
-    # Find teacher by email
+    # Find teacher by email. The lower() predicate matches the
+    # lower(email) expression index (the only email index after 0008);
+    # raiseload guards against accidental lazy relationship loads on
+    # this hot path.
     result = await db.execute(
-        select(Teacher).where(Teacher.email == data.email)
+        select(Teacher)
+        .where(func.lower(Teacher.email) == data.email.lower())
+        .options(raiseload("*"))
     )
     teacher = result.scalar_one_or_none()
 
@@ -193,14 +233,23 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify password
+    # Verify password off the event loop, upgrading legacy hashes on success
     password_hash = getattr(teacher, "password_hash", None)
-    if not password_hash or not verify_password(data.password, password_hash):
+    if password_hash:
+        valid, new_hash = await asyncio.to_thread(
+            verify_and_update_password, data.password, password_hash
+        )
+    else:
+        valid, new_hash = False, None
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        teacher.password_hash = new_hash
+        await db.commit()
 
     # Generate token
     access_token = create_access_token(
@@ -209,7 +258,7 @@ async def login(
 
     return TokenResponse(
         access_token=access_token,
-        expires_in=settings.jwt_expiration_hours * 3600,
+        expires_in=JWT_EXPIRES_IN_SECONDS,
         teacher_id=teacher.id,
         teacher_code=teacher.teacher_code,
         role=teacher.role,
@@ -226,9 +275,12 @@ async def login_for_access_token(
 
     Accepts form data with username (email) and password.
     """
-    # Find teacher by email (username field)
+    # Find teacher by email (username field); lower() predicate matches
+    # the lower(email) expression index
     result = await db.execute(
-        select(Teacher).where(Teacher.email == form_data.username)
+        select(Teacher)
+        .where(func.lower(Teacher.email) == form_data.username.lower())
+        .options(raiseload("*"))
     )
     teacher = result.scalar_one_or_none()
 
@@ -239,14 +291,23 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify password
+    # Verify password off the event loop, upgrading legacy hashes on success
     password_hash = getattr(teacher, "password_hash", None)
-    if not password_hash or not verify_password(form_data.password, password_hash):
+    if password_hash:
+        valid, new_hash = await asyncio.to_thread(
+            verify_and_update_password, form_data.password, password_hash
+        )
+    else:
+        valid, new_hash = False, None
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        teacher.password_hash = new_hash
+        await db.commit()
 
     # Generate token
     access_token = create_access_token(
@@ -255,7 +316,7 @@ async def login_for_access_token(
 
     return TokenResponse(
         access_token=access_token,
-        expires_in=settings.jwt_expiration_hours * 3600,
+        expires_in=JWT_EXPIRES_IN_SECONDS,
         teacher_id=teacher.id,
         teacher_code=teacher.teacher_code,
         role=teacher.role,
@@ -265,7 +326,7 @@ async def login_for_access_token(
 @router.get("/me", response_model=TeacherProfile)
 async def get_current_teacher_profile(
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[Teacher, Depends(__import__("app.api.deps", fromlist=["require_auth"]).require_auth)],
+    current_user: Annotated[Teacher, Depends(require_auth)],
 ) -> TeacherProfile:
     """
     Get the current authenticated teacher's profile.
@@ -277,22 +338,27 @@ async def get_current_teacher_profile(
 async def change_password(
     data: PasswordChange,
     db: Annotated[AsyncSession, Depends(get_db)],
-    current_user: Annotated[Teacher, Depends(__import__("app.api.deps", fromlist=["require_auth"]).require_auth)],
+    current_user: Annotated[Teacher, Depends(require_auth)],
 ) -> dict[str, str]:
     """
     Change the current teacher's password.
     """
-    # Verify current password
+    # Verify current password (in a worker thread; hashing is CPU-bound)
     password_hash = getattr(current_user, "password_hash", None)
-    if not password_hash or not verify_password(data.current_password, password_hash):
+    if not password_hash or not await asyncio.to_thread(
+        verify_password, data.current_password, password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
-    # Update password
-    current_user.password_hash = get_password_hash(data.new_password)  # type: ignore
+    # Update password (merge: current_user may be a detached cached instance)
+    new_password_hash = await asyncio.to_thread(get_password_hash, data.new_password)
+    teacher = await db.merge(current_user)
+    teacher.password_hash = new_password_hash  # type: ignore
     await db.commit()
+    invalidate_teacher_cache(teacher.teacher_code)
 
     return {"message": "Password changed successfully"}
 
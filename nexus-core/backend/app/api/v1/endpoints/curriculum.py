@@ -7,14 +7,19 @@ Endpoints for querying Alberta Program of Studies outcomes.
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
 from app.db.models import CurriculumOutcome
 
-router = APIRouter(prefix="/curriculum", tags=["curriculum"])
+router = APIRouter(
+    prefix="/curriculum",
+    tags=["curriculum"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # === Pydantic Schemas ===
@@ -36,6 +41,11 @@ class CurriculumOutcomeResponse(BaseModel):
         from_attributes = True
 
 
+# Validates a whole page of ORM rows in one pydantic-core pass instead of
+# a Python-level model_validate call per row.
+CURRICULUM_OUTCOME_LIST = TypeAdapter(list[CurriculumOutcomeResponse])
+
+
 class CurriculumOutcomeCreate(BaseModel):
     """Request schema for creating a curriculum outcome."""
 
@@ -85,9 +95,11 @@ async def search_curriculum(
             | CurriculumOutcome.keywords.ilike(f"%{keyword}%")
         )
 
-    # Count total
-    count_result = await db.execute(query)
-    total = len(count_result.scalars().all())
+    # Count total in SQL instead of materializing every matching row
+    count_result = await db.execute(
+        select(func.count()).select_from(query.subquery())
+    )
+    total = count_result.scalar_one()
 
     # Get page
     query = query.order_by(CurriculumOutcome.grade, CurriculumOutcome.subject)
@@ -97,7 +109,7 @@ async def search_curriculum(
     outcomes = result.scalars().all()
 
     return CurriculumSearchResponse(
-        outcomes=[CurriculumOutcomeResponse.model_validate(o) for o in outcomes],
+        outcomes=CURRICULUM_OUTCOME_LIST.validate_python(outcomes, from_attributes=True),
         total=total,
     )
 
@@ -4,19 +4,95 @@ Reports API endpoints.
 Endpoints for accessing and managing Scout Reports.
 """
 
+import hashlib
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.deps import TeacherAccess, get_db
-from app.db.models import EngagementLevel, OracySession, ScoutReport, Teacher
+from app.api.pagination import decode_cursor, encode_cursor
+from app.core.cache import TTLCache
+from app.db.models import EngagementLevel, OracySession, ScoutReport, Student, Teacher
+
+router = APIRouter(
+    prefix="/reports",
+    tags=["reports"],
+    default_response_class=ORJSONResponse,
+)
+
+# Read-through response caches (in-process; the stack runs a single
+# backend instance and no Redis). List pages go stale within 30s or on
+# any report mutation via invalidate_report_caches(); the copyable view
+# only contains generation-time fields, which are immutable, so it keeps
+# entries for an hour.
+_list_cache: TTLCache[tuple, "ScoutReportListResponse"] = TTLCache(
+    ttl_seconds=30.0, max_size=512
+)
+_copy_cache: TTLCache[str, "CopyableReportResponse"] = TTLCache(
+    ttl_seconds=3600.0, max_size=1024
+)
+
+
+def invalidate_report_caches() -> None:
+    """Drop cached list pages after a report mutation."""
+    _list_cache.clear()
+
+
+# Prebuilt single-row lookups: only the bound report id changes between
+# requests, so the expression tree (and its compiled-cache entry) is
+# constructed once at import instead of per request. The joined variant
+# fetches the report plus the session/student scalars the detail views
+# serialize in ONE round-trip, where the selectinload chain cost three.
+REPORT_SESSION_JOIN_STMT = (
+    select(
+        ScoutReport,
+        OracySession.id.label("session_id"),
+        OracySession.duration_seconds,
+        OracySession.turn_count,
+        OracySession.transcript_summary,
+        OracySession.started_at,
+        OracySession.ended_at,
+        Student.student_code,
+    )
+    .join(OracySession, OracySession.id == ScoutReport.oracy_session_id, isouter=True)
+    .join(Student, Student.id == OracySession.student_id, isouter=True)
+    .where(ScoutReport.id == bindparam("report_id"))
+)
+
+REPORT_BY_ID_STMT = select(ScoutReport).where(ScoutReport.id == bindparam("report_id"))
+
+
+def _report_etag(report: ScoutReport, include: list[str] | None = None) -> str:
+    """
+    Weak ETag for a report view.
+
+    Covers every field a PATCH can change (review state, notes, review
+    timestamp) so a notes-only update invalidates cached copies too; the
+    transcript variant gets its own tag since it serializes additional
+    fields.
+    """
+    stamp = int((report.reviewed_at or report.created_at).timestamp())
+    version = hashlib.md5(
+        f"{report.id}:{stamp}:{report.is_reviewed}:{report.teacher_notes or ''}".encode()
+    ).hexdigest()[:16]
+    suffix = "-t" if include and "transcript" in include else ""
+    return f'W/"{version}{suffix}"'
+
 
-router = APIRouter(prefix="/reports", tags=["reports"])
+# Section labels for the copyable IPP text, paired with the report field
+# that fills each one.
+COPY_SECTIONS = (
+    ("OBSERVATION SUMMARY", "insight_text"),
+    ("LANGUAGE DEVELOPMENT", "linguistic_observations"),
+    ("CURRICULUM CONNECTIONS", "curriculum_connections"),
+    ("RECOMMENDED NEXT STEPS", "recommended_next_steps"),
+)
 
 
 # === Pydantic Schemas ===
@@ -50,6 +126,14 @@ class ScoutReportWithSessionResponse(ScoutReportResponse):
     student_code: str | None = None
 
 
+class ScoutReportDetailResponse(ScoutReportWithSessionResponse):
+    """Scout report with optionally included transcript payload."""
+
+    transcript_summary: str | None = None
+    started_at: datetime | None = None
+    ended_at: datetime | None = None
+
+
 class ScoutReportListResponse(BaseModel):
     """Response schema for a list of scout reports."""
 
@@ -57,6 +141,7 @@ class ScoutReportListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class ScoutReportUpdate(BaseModel):
@@ -87,7 +172,12 @@ async def list_scout_reports(
     is_reviewed: bool | None = Query(None, description="Filter by review status"),
     engagement_level: EngagementLevel | None = Query(None, description="Filter by engagement"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    page_size: int = Query(
+        20, ge=0, le=100, description="Items per page (0 = count only)"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from next_cursor; overrides page"
+    ),
 ) -> ScoutReportListResponse:
     """
     List scout reports with optional filters.
@@ -95,36 +185,94 @@ async def list_scout_reports(
     Teachers can use this to find reports needing review.
     Requires authentication in production.
     """
-    query = select(ScoutReport).options(
-        selectinload(ScoutReport.oracy_session).selectinload(OracySession.student)
-    )
+    cache_key = (teacher_id, is_reviewed, engagement_level, page, page_size, cursor)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
+    filters = []
     if teacher_id:
-        query = query.where(ScoutReport.teacher_id == teacher_id)
+        filters.append(ScoutReport.teacher_id == teacher_id)
     if is_reviewed is not None:
-        query = query.where(ScoutReport.is_reviewed == is_reviewed)
+        filters.append(ScoutReport.is_reviewed == is_reviewed)
     if engagement_level:
-        query = query.where(ScoutReport.engagement_level == engagement_level)
+        filters.append(ScoutReport.engagement_level == engagement_level)
 
-    # Count total
-    count_result = await db.execute(query)
-    total = len(count_result.scalars().all())
+    # Count total in SQL instead of materializing (and eager-loading) every
+    # matching report just to len() the list
+    count_result = await db.execute(
+        select(func.count(ScoutReport.id)).where(*filters)
+    )
+    total = count_result.scalar_one()
 
-    # Get page
-    query = query.order_by(ScoutReport.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # Count-only mode: dashboard widgets that just need the total skip
+    # row materialization and eager loading entirely
+    if page_size == 0:
+        return ScoutReportListResponse.model_construct(
+            reports=[], total=total, page=page, page_size=0, next_cursor=None
+        )
+
+    # Get page. With a cursor the page starts at an index seek on
+    # (created_at, id); offset pagination remains for first/legacy calls.
+    # load_only trims the eager-loaded rows to the fields the list
+    # response actually serializes — notably excluding the session's
+    # transcript_summary TEXT blob.
+    #
+    # Each selectinload hop issues one batched query whose IN list is an
+    # expanding bind parameter, so the statement shape (and the prepared
+    # statement behind it) is identical regardless of page contents. With
+    # page_size capped at 100 we always stay below SQLAlchemy's 500-row
+    # selectin shard size, so the hop is exactly one extra query per level
+    # and never needs chunk tuning.
+    query = (
+        select(ScoutReport)
+        .options(
+            selectinload(ScoutReport.oracy_session)
+            .load_only(OracySession.duration_seconds, OracySession.turn_count)
+            .selectinload(OracySession.student)
+            .load_only(Student.student_code),
+            # Any relationship not loaded above must fail loudly rather than
+            # fire a hidden lazy load per row in async context
+            raiseload("*"),
+        )
+        .where(*filters)
+        .order_by(ScoutReport.created_at.desc(), ScoutReport.id.desc())
+    )
+    if cursor:
+        try:
+            last_created, last_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            ) from None
+        query = query.where(
+            tuple_(ScoutReport.created_at, ScoutReport.id)
+            < tuple_(last_created, last_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
 
-    result = await db.execute(query)
+    # Fetch one extra row to know whether a next page exists
+    result = await db.execute(query.limit(page_size + 1))
     reports = result.scalars().all()
+    has_next = len(reports) > page_size
+    reports = reports[:page_size]
+    next_cursor = (
+        encode_cursor(reports[-1].created_at, reports[-1].id)
+        if has_next and reports
+        else None
+    )
 
-    # Build response with session info
+    # Build response with session info. model_construct skips per-field
+    # validation: every value comes straight off already-typed ORM rows.
     response_reports = []
     for report in reports:
         session = report.oracy_session
         student_code = session.student.student_code if session and session.student else None
 
         response_reports.append(
-            ScoutReportWithSessionResponse(
+            ScoutReportWithSessionResponse.model_construct(
                 id=report.id,
                 oracy_session_id=report.oracy_session_id,
                 teacher_id=report.teacher_id,
@@ -143,40 +291,58 @@ async def list_scout_reports(
             )
         )
 
-    return ScoutReportListResponse(
+    response = ScoutReportListResponse.model_construct(
         reports=response_reports,
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
+    _list_cache.set(cache_key, response)
+    return response
 
 
-@router.get("/{report_id}", response_model=ScoutReportWithSessionResponse)
+@router.get("/{report_id}", response_model=ScoutReportDetailResponse)
 async def get_scout_report(
     report_id: str,
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     _teacher: TeacherAccess,  # Require teacher access in production
-) -> ScoutReportWithSessionResponse:
-    """Get a specific scout report by ID. Requires authentication in production."""
-    result = await db.execute(
-        select(ScoutReport)
-        .where(ScoutReport.id == report_id)
-        .options(
-            selectinload(ScoutReport.oracy_session).selectinload(OracySession.student)
-        )
-    )
-    report = result.scalar_one_or_none()
+    include: Annotated[
+        list[str],
+        Query(description='Extra payloads to embed; supports "transcript"'),
+    ] = [],  # noqa: B006 - FastAPI re-evaluates Query defaults per request
+) -> ScoutReportDetailResponse | Response:
+    """
+    Get a specific scout report by ID. Requires authentication in production.
 
-    if not report:
+    Pass include=transcript to embed the session transcript fields and
+    skip the follow-up /transcript round-trip; the session row is already
+    eager-loaded either way.
+    """
+    row = (
+        await db.execute(REPORT_SESSION_JOIN_STMT, {"report_id": report_id})
+    ).first()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Scout report {report_id} not found",
         )
 
-    session = report.oracy_session
-    student_code = session.student.student_code if session and session.student else None
+    report = row.ScoutReport
 
-    return ScoutReportWithSessionResponse(
+    # Teachers re-open the same report often; a matching If-None-Match
+    # skips serialization and transfer entirely
+    etag = _report_etag(report, include)
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
+    detail = ScoutReportDetailResponse(
         id=report.id,
         oracy_session_id=report.oracy_session_id,
         teacher_id=report.teacher_id,
@@ -189,16 +355,23 @@ async def get_scout_report(
         teacher_notes=report.teacher_notes,
         created_at=report.created_at,
         reviewed_at=report.reviewed_at,
-        session_duration_seconds=session.duration_seconds if session else None,
-        session_turn_count=session.turn_count if session else 0,
-        student_code=student_code,
+        session_duration_seconds=row.duration_seconds,
+        session_turn_count=row.turn_count or 0,
+        student_code=row.student_code,
     )
 
+    if row.session_id and "transcript" in include:
+        detail.transcript_summary = row.transcript_summary
+        detail.started_at = row.started_at
+        detail.ended_at = row.ended_at
+
+    return detail
+
 
 @router.patch("/{report_id}", response_model=ScoutReportResponse)
 async def update_scout_report(
     report_id: str,
-    update: ScoutReportUpdate,
+    patch: ScoutReportUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
     _teacher: TeacherAccess,  # Require teacher access in production
 ) -> ScoutReportResponse:
@@ -208,10 +381,27 @@ async def update_scout_report(
     Teachers can add notes and mark reports as reviewed.
     Requires authentication in production.
     """
-    result = await db.execute(
-        select(ScoutReport).where(ScoutReport.id == report_id)
-    )
-    report = result.scalar_one_or_none()
+    # Single UPDATE ... RETURNING round-trip instead of
+    # SELECT + mutate + COMMIT + refresh
+    values = patch.model_dump(exclude_unset=True, exclude_none=True)
+    if values.get("is_reviewed"):
+        # DB-side clock: timezone-consistent across replicas and no Python
+        # time syscall (the old naive datetime.now() stored local time)
+        values["reviewed_at"] = func.now()
+
+    if values:
+        result = await db.execute(
+            update(ScoutReport)
+            .where(ScoutReport.id == report_id)
+            .values(**values)
+            .returning(ScoutReport)
+        )
+        report = result.scalar_one_or_none()
+    else:
+        result = await db.execute(
+            select(ScoutReport).where(ScoutReport.id == report_id)
+        )
+        report = result.scalar_one_or_none()
 
     if not report:
         raise HTTPException(
@@ -219,16 +409,8 @@ async def update_scout_report(
             detail=f"Scout report {report_id} not found",
         )
 
-    # Apply updates
-    if update.teacher_notes is not None:
-        report.teacher_notes = update.teacher_notes
-    if update.is_reviewed is not None:
-        report.is_reviewed = update.is_reviewed
-        if update.is_reviewed:
-            report.reviewed_at = datetime.now()
-
     await db.commit()
-    await db.refresh(report)
+    invalidate_report_caches()
 
     return ScoutReportResponse.model_validate(report)
 
@@ -236,18 +418,31 @@ async def update_scout_report(
 @router.get("/{report_id}/copy", response_model=CopyableReportResponse)
 async def get_copyable_report(
     report_id: str,
+    request: Request,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     _teacher: TeacherAccess,  # Require teacher access in production
-) -> CopyableReportResponse:
+) -> CopyableReportResponse | Response:
     """
     Get a scout report formatted for copying to IPP documents.
 
     This is the "killer feature" for teachers - one-click copy.
     Requires authentication in production.
     """
-    result = await db.execute(
-        select(ScoutReport).where(ScoutReport.id == report_id)
-    )
+    # The copyable payload is immutable per report, so the id alone is a
+    # valid ETag; a match needs neither the cache nor the database.
+    etag = f'W/"copy-{report_id}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
+    cached = _copy_cache.get(report_id)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(REPORT_BY_ID_STMT, {"report_id": report_id})
     report = result.scalar_one_or_none()
 
     if not report:
@@ -256,28 +451,23 @@ async def get_copyable_report(
             detail=f"Scout report {report_id} not found",
         )
 
-    # Format for IPP copy
-    sections = []
-    sections.append(f"OBSERVATION SUMMARY\n{report.insight_text}")
-
-    if report.linguistic_observations:
-        sections.append(f"LANGUAGE DEVELOPMENT\n{report.linguistic_observations}")
-
-    if report.curriculum_connections:
-        sections.append(f"CURRICULUM CONNECTIONS\n{report.curriculum_connections}")
-
-    if report.recommended_next_steps:
-        sections.append(f"RECOMMENDED NEXT STEPS\n{report.recommended_next_steps}")
-
-    formatted_text = "\n\n".join(sections)
+    # Format for IPP copy: one pass over the section table. The result is
+    # memoized per report by _copy_cache above.
+    formatted_text = "\n\n".join(
+        f"{label}\n{value}"
+        for label, field in COPY_SECTIONS
+        if (value := getattr(report, field))
+    )
 
-    return CopyableReportResponse(
+    response = CopyableReportResponse(
         insight_text=report.insight_text,
         linguistic_observations=report.linguistic_observations,
         curriculum_connections=report.curriculum_connections,
         recommended_next_steps=report.recommended_next_steps,
         formatted_text=formatted_text,
     )
+    _copy_cache.set(report_id, response)
+    return response
 
 
 class TranscriptResponse(BaseModel):
@@ -293,7 +483,7 @@ class TranscriptResponse(BaseModel):
     ended_at: datetime | None = None
 
 
-@router.get("/{report_id}/transcript", response_model=TranscriptResponse)
+@router.get("/{report_id}/transcript", response_model=TranscriptResponse, deprecated=True)
 async def get_transcript(
     report_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -309,37 +499,29 @@ async def get_transcript(
     Note: Full audio is NEVER stored per privacy charter. Only the
     summarized, anonymized transcript text is available.
     """
-    result = await db.execute(
-        select(ScoutReport)
-        .where(ScoutReport.id == report_id)
-        .options(
-            selectinload(ScoutReport.oracy_session).selectinload(OracySession.student)
-        )
-    )
-    report = result.scalar_one_or_none()
+    row = (
+        await db.execute(REPORT_SESSION_JOIN_STMT, {"report_id": report_id})
+    ).first()
 
-    if not report:
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Scout report {report_id} not found",
         )
 
-    session = report.oracy_session
-    if not session:
+    if not row.session_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No oracy session found for report {report_id}",
         )
 
-    student_code = session.student.student_code if session.student else None
-
     return TranscriptResponse(
         report_id=report_id,
-        session_id=session.id,
-        student_code=student_code,
-        transcript_summary=session.transcript_summary,
-        session_duration_seconds=session.duration_seconds,
-        session_turn_count=session.turn_count,
-        started_at=session.started_at,
-        ended_at=session.ended_at,
+        session_id=row.session_id,
+        student_code=row.student_code,
+        transcript_summary=row.transcript_summary,
+        session_duration_seconds=row.duration_seconds,
+        session_turn_count=row.turn_count,
+        started_at=row.started_at,
+        ended_at=row.ended_at,
     )
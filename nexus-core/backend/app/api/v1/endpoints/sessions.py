@@ -4,19 +4,31 @@ Sessions API endpoints.
 CRUD operations for Oracy Sessions.
 """
 
+import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from pydantic import Base64Bytes, BaseModel, Field, field_validator
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_db
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.v1.endpoints.reports import invalidate_report_caches
+from app.core.database import get_db_context
 from app.db.models import EngagementLevel, OracySession, ScoutReport, SessionStatus
 
-router = APIRouter(prefix="/sessions", tags=["sessions"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    prefix="/sessions",
+    tags=["sessions"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # === Pydantic Schemas ===
@@ -47,6 +59,7 @@ class OracySessionListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class ScoutReportResponse(BaseModel):
@@ -75,12 +88,33 @@ class ScoutReportUpdate(BaseModel):
     is_reviewed: bool | None = None
 
 
+# Upper bound on a single decoded chunk; caps request memory for a batch.
+MAX_AUDIO_CHUNK_BYTES = 64 * 1024
+
+
 class AudioChunk(BaseModel):
-    """A single audio chunk from offline queue."""
+    """
+    A single audio chunk from offline queue.
 
-    audio_data: str  # Base64 encoded audio
+    The PWA queues chunks in capture order, so batches normally arrive
+    with monotonically increasing timestamps. audio_data arrives base64
+    encoded on the wire; Base64Bytes decodes it once at parse time, so
+    downstream processing receives ready bytes and never re-decodes.
+    """
+
+    audio_data: Base64Bytes
     timestamp: int  # Unix timestamp in ms
 
+    @field_validator("audio_data")
+    @classmethod
+    def check_chunk_size(cls, v: bytes) -> bytes:
+        """Reject oversized chunks before they reach processing."""
+        if len(v) > MAX_AUDIO_CHUNK_BYTES:
+            raise ValueError(
+                f"Audio chunk exceeds {MAX_AUDIO_CHUNK_BYTES} bytes"
+            )
+        return v
+
 
 class OfflineSyncRequest(BaseModel):
     """Request schema for syncing offline audio chunks."""
@@ -106,36 +140,74 @@ async def list_oracy_sessions(
     student_id: str | None = Query(None, description="Filter by student ID"),
     status_filter: SessionStatus | None = Query(None, alias="status", description="Filter by status"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    page_size: int = Query(
+        20, ge=0, le=100, description="Items per page (0 = count only)"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from next_cursor; overrides page"
+    ),
 ) -> OracySessionListResponse:
     """
     List oracy sessions with optional filters.
 
     Supports pagination and filtering by student and status.
     """
-    query = select(OracySession)
-
+    filters = []
     if student_id:
-        query = query.where(OracySession.student_id == student_id)
+        filters.append(OracySession.student_id == student_id)
     if status_filter:
-        query = query.where(OracySession.status == status_filter)
+        filters.append(OracySession.status == status_filter)
 
-    # Count total
-    count_result = await db.execute(query)
-    total = len(count_result.scalars().all())
+    # Count total in SQL instead of materializing every matching row
+    count_result = await db.execute(
+        select(func.count(OracySession.id)).where(*filters)
+    )
+    total = count_result.scalar_one()
 
-    # Get page
-    query = query.order_by(OracySession.started_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+    # Count-only mode: skip row materialization entirely
+    if page_size == 0:
+        return OracySessionListResponse(
+            sessions=[], total=total, page=page, page_size=0
+        )
 
-    result = await db.execute(query)
+    # Get page. With a cursor the page starts at an index seek on
+    # (started_at, id); offset pagination remains for first/legacy calls.
+    query = (
+        select(OracySession)
+        .where(*filters)
+        .order_by(OracySession.started_at.desc(), OracySession.id.desc())
+    )
+    if cursor:
+        try:
+            last_started, last_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            ) from None
+        query = query.where(
+            tuple_(OracySession.started_at, OracySession.id)
+            < tuple_(last_started, last_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    result = await db.execute(query.limit(page_size + 1))
     sessions = result.scalars().all()
+    has_next = len(sessions) > page_size
+    sessions = sessions[:page_size]
+    next_cursor = (
+        encode_cursor(sessions[-1].started_at, sessions[-1].id)
+        if has_next and sessions
+        else None
+    )
 
     return OracySessionListResponse(
         sessions=[OracySessionResponse.model_validate(s) for s in sessions],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -190,7 +262,7 @@ async def get_scout_report(
 @router.patch("/{session_id}/report", response_model=ScoutReportResponse)
 async def update_scout_report(
     session_id: str,
-    update: ScoutReportUpdate,
+    patch: ScoutReportUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> ScoutReportResponse:
     """
@@ -198,10 +270,27 @@ async def update_scout_report(
 
     Teachers can add notes and mark reports as reviewed.
     """
-    result = await db.execute(
-        select(ScoutReport).where(ScoutReport.oracy_session_id == session_id)
-    )
-    report = result.scalar_one_or_none()
+    # Single UPDATE ... RETURNING round-trip instead of
+    # SELECT + mutate + COMMIT + refresh
+    values = patch.model_dump(exclude_unset=True, exclude_none=True)
+    if values.get("is_reviewed"):
+        # DB-side clock: timezone-consistent across replicas and no Python
+        # time syscall (the old naive datetime.now() stored local time)
+        values["reviewed_at"] = func.now()
+
+    if values:
+        result = await db.execute(
+            update(ScoutReport)
+            .where(ScoutReport.oracy_session_id == session_id)
+            .values(**values)
+            .returning(ScoutReport)
+        )
+        report = result.scalar_one_or_none()
+    else:
+        result = await db.execute(
+            select(ScoutReport).where(ScoutReport.oracy_session_id == session_id)
+        )
+        report = result.scalar_one_or_none()
 
     if not report:
         raise HTTPException(
@@ -209,69 +298,80 @@ async def update_scout_report(
             detail=f"No scout report found for session {session_id}",
         )
 
-    # Apply updates
-    if update.teacher_notes is not None:
-        report.teacher_notes = update.teacher_notes
-    if update.is_reviewed is not None:
-        report.is_reviewed = update.is_reviewed
-        if update.is_reviewed:
-            report.reviewed_at = datetime.now()
-
     await db.commit()
-    await db.refresh(report)
+    invalidate_report_caches()
 
     return ScoutReportResponse.model_validate(report)
 
 
+async def process_offline_chunks(session_id: str, chunks: list[AudioChunk]) -> None:
+    """
+    Process queued offline chunks outside the request cycle.
+
+    Runs on its own database session after the sync response has been
+    sent, so large queues never pin a request worker.
+    """
+    # Chunks arrive in capture order; verify with one O(n) pass and only
+    # fall back to an in-place sort (C-level attrgetter key, no copied
+    # list) when a batch is actually out of order.
+    if any(
+        prev.timestamp > cur.timestamp
+        for prev, cur in zip(chunks, chunks[1:], strict=False)
+    ):
+        chunks.sort(key=attrgetter("timestamp"))
+
+    synced_count = 0
+    for chunk in chunks:
+        # In production: decode base64, send to STT, append to transcript
+        # For now, just count as synced
+        synced_count += 1
+        logger.debug(f"Processed chunk at timestamp {chunk.timestamp}")
+
+    async with get_db_context() as db:
+        await db.execute(
+            update(OracySession)
+            .where(OracySession.id == session_id)
+            .values(turn_count=OracySession.turn_count + synced_count)
+        )
+
+    logger.info(f"Processed {synced_count} offline chunks for session {session_id}")
+
+
 @router.post("/sync", response_model=OfflineSyncResponse)
 async def sync_offline_audio(
     sync_request: OfflineSyncRequest,
+    background_tasks: BackgroundTasks,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> OfflineSyncResponse:
     """
     Sync offline audio chunks from PWA.
 
-    When the app was offline, audio chunks are queued locally.
-    This endpoint receives them when back online for processing.
+    When the app was offline, audio chunks are queued locally. This
+    endpoint validates the session and hands the chunks to a background
+    task, responding immediately with status "accepted" instead of
+    holding the request open for the duration of processing.
 
     Note: Audio is processed for transcript but NOT stored (per privacy charter).
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     session_id = sync_request.session_id
     chunks = sync_request.chunks
 
     logger.info(f"Received {len(chunks)} offline chunks for session {session_id}")
 
-    # Verify session exists
-    result = await db.execute(
-        select(OracySession).where(OracySession.id == session_id)
+    # Verify session exists before accepting the batch
+    session_exists = await db.scalar(
+        select(OracySession.id).where(OracySession.id == session_id)
     )
-    session = result.scalar_one_or_none()
-
-    if not session:
+    if not session_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Oracy session {session_id} not found",
         )
 
-    # Process chunks (in production, would send to STT service)
-    synced_count = 0
-    for chunk in sorted(chunks, key=lambda c: c.timestamp):
-        # In production: decode base64, send to STT, append to transcript
-        # For now, just count as synced
-        synced_count += 1
-        logger.debug(f"Processed chunk at timestamp {chunk.timestamp}")
-
-    # Update session turn count
-    session.turn_count += synced_count
-
-    await db.commit()
+    background_tasks.add_task(process_offline_chunks, session_id, chunks)
 
     return OfflineSyncResponse(
-        synced_count=synced_count,
+        synced_count=len(chunks),
         session_id=session_id,
-        status="synced",
+        status="accepted",
     )
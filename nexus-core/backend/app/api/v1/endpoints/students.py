@@ -7,14 +7,21 @@ CRUD operations for Student records.
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.api.pagination import decode_cursor, encode_cursor
 from app.db.models import Student
 
-router = APIRouter(prefix="/students", tags=["students"])
+router = APIRouter(
+    prefix="/students",
+    tags=["students"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # === Pydantic Schemas ===
@@ -49,6 +56,7 @@ class StudentListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class StudentUpdate(BaseModel):
@@ -72,16 +80,6 @@ async def create_student(
 
     Note: student_code should be a hashed identifier, NOT the student's name.
     """
-    # Check if student_code already exists
-    existing = await db.execute(
-        select(Student).where(Student.student_code == student.student_code)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Student with code {student.student_code} already exists",
-        )
-
     db_student = Student(
         student_code=student.student_code,
         grade=student.grade,
@@ -89,7 +87,18 @@ async def create_student(
         school_code=student.school_code,
     )
     db.add(db_student)
-    await db.commit()
+
+    # The unique index on student_code is the authority: inserting and
+    # catching the violation is one round-trip and, unlike a pre-check
+    # SELECT, has no window for a concurrent duplicate insert.
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Student with code {student.student_code} already exists",
+        ) from None
     await db.refresh(db_student)
 
     return StudentResponse.model_validate(db_student)
@@ -101,32 +110,65 @@ async def list_students(
     school_code: str | None = Query(None, description="Filter by school code"),
     grade: int | None = Query(None, ge=0, le=12, description="Filter by grade"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    page_size: int = Query(
+        20, ge=0, le=100, description="Items per page (0 = count only)"
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque cursor from next_cursor; overrides page"
+    ),
 ) -> StudentListResponse:
     """List students with optional filters."""
-    query = select(Student)
-
+    filters = []
     if school_code:
-        query = query.where(Student.school_code == school_code)
+        filters.append(Student.school_code == school_code)
     if grade is not None:
-        query = query.where(Student.grade == grade)
-
-    # Count total
-    count_result = await db.execute(query)
-    total = len(count_result.scalars().all())
-
-    # Get page
-    query = query.order_by(Student.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
+        filters.append(Student.grade == grade)
+
+    # Count total in SQL instead of materializing every matching row
+    count_result = await db.execute(select(func.count(Student.id)).where(*filters))
+    total = count_result.scalar_one()
+
+    # Count-only mode: skip row materialization entirely
+    if page_size == 0:
+        return StudentListResponse(students=[], total=total, page=page, page_size=0)
+
+    # Get page. With a cursor the page starts at an index seek on
+    # (created_at, id); offset pagination remains for first/legacy calls.
+    query = (
+        select(Student)
+        .where(*filters)
+        .order_by(Student.created_at.desc(), Student.id.desc())
+    )
+    if cursor:
+        try:
+            last_created, last_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            ) from None
+        query = query.where(
+            tuple_(Student.created_at, Student.id) < tuple_(last_created, last_id)
+        )
+    else:
+        query = query.offset((page - 1) * page_size)
 
-    result = await db.execute(query)
+    result = await db.execute(query.limit(page_size + 1))
     students = result.scalars().all()
+    has_next = len(students) > page_size
+    students = students[:page_size]
+    next_cursor = (
+        encode_cursor(students[-1].created_at, students[-1].id)
+        if has_next and students
+        else None
+    )
 
     return StudentListResponse(
         students=[StudentResponse.model_validate(s) for s in students],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -153,14 +195,27 @@ async def get_student(
 @router.patch("/{student_code}", response_model=StudentResponse)
 async def update_student(
     student_code: str,
-    update: StudentUpdate,
+    patch: StudentUpdate,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> StudentResponse:
     """Update a student's information."""
-    result = await db.execute(
-        select(Student).where(Student.student_code == student_code)
-    )
-    student = result.scalar_one_or_none()
+    # Single UPDATE ... RETURNING round-trip instead of
+    # SELECT + mutate + COMMIT + refresh
+    values = patch.model_dump(exclude_unset=True, exclude_none=True)
+
+    if values:
+        result = await db.execute(
+            update(Student)
+            .where(Student.student_code == student_code)
+            .values(**values)
+            .returning(Student)
+        )
+        student = result.scalar_one_or_none()
+    else:
+        result = await db.execute(
+            select(Student).where(Student.student_code == student_code)
+        )
+        student = result.scalar_one_or_none()
 
     if not student:
         raise HTTPException(
@@ -168,16 +223,7 @@ async def update_student(
             detail=f"Student with code {student_code} not found",
         )
 
-    # Apply updates
-    if update.grade is not None:
-        student.grade = update.grade
-    if update.primary_language is not None:
-        student.primary_language = update.primary_language
-    if update.school_code is not None:
-        student.school_code = update.school_code
-
     await db.commit()
-    await db.refresh(student)
 
     return StudentResponse.model_validate(student)
 
@@ -7,20 +7,25 @@ to disk per .context/02_privacy_charter.md.
 """
 
 import asyncio
-import base64
+import binascii
 import contextlib
+import functools
 import json
 import logging
 import time
+from array import array
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from math import sqrt
 from typing import Any
 from uuid import uuid4
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
+from sqlalchemy import select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import async_session_factory
@@ -58,27 +63,196 @@ class MessageType(str, Enum):
     LATENCY_UPDATE = "latency_update"
 
 
-class SessionState(BaseModel):
-    """State tracking for an active oracy session."""
+@dataclass(slots=True)
+class SessionState:
+    """
+    State tracking for an active oracy session.
+
+    A plain slots dataclass rather than a pydantic model: the per-turn
+    counter and timestamp updates are hot attribute writes, the object
+    never crosses the wire, and validate-on-assignment was pure overhead.
+    """
 
     session_id: str
     student_code: str
+    started_at: datetime
     student_id: str | None = None
     student_grade: int = 5
     student_language: str = "Unknown"
     curriculum_outcome: str | None = None
-    started_at: datetime
     turn_count: int = 0
-    latencies: list[float] = []
-    conversation_history: list[dict[str, Any]] = []
+    # Running latency mean (Welford): only the average is ever read, so a
+    # per-turn list would grow unboundedly for no benefit.
+    latency_count: int = 0
+    latency_mean: float = 0.0
+    conversation_history: list[dict[str, Any]] = field(default_factory=list)
+    # Mirror of conversation_history as ConversationTurn objects, appended
+    # in add_conversation_turn, so context building reuses the same list
+    # instead of reconstructing O(history) objects every turn.
+    turns: list[ConversationTurn] = field(default_factory=list)
     is_active: bool = True
     audio_buffer: bytes = b""  # Buffer for accumulating audio chunks
-    last_activity: datetime = datetime.now(UTC)  # For session recovery
+    # End-of-session stats, computed once in end_session and reused by
+    # finalize_oracy_session and the SESSION_ENDED message.
+    ended_at: datetime | None = None
+    duration_seconds: int | None = None
+    avg_latency_ms: float | None = None
+    # time.monotonic() of the last touch, for session recovery TTLs.
+    # A monotonic float is immune to clock steps and far cheaper than
+    # allocating a tz-aware datetime on every update.
+    last_activity: float = 0.0
 
 
 # Session recovery: keep recently disconnected sessions for potential reconnection
 DISCONNECTED_SESSION_TTL_SECONDS = 300  # 5 minutes
 
+# How often the shared reaper scans for expired disconnected sessions
+REAP_INTERVAL_SECONDS = 30
+
+# Transcript summaries keep at most this many trailing turns; multi-hour
+# sessions should not retain (or store) the entire conversation twice.
+TRANSCRIPT_SUMMARY_MAX_TURNS = 200
+
+SPEAKER_LABELS = {"user": "Student", "assistant": "NEXUS"}
+
+# Process accumulated audio once ~2 seconds are buffered
+# (24000 samples/sec * 2 bytes/sample * 2 sec)
+AUDIO_PROCESS_THRESHOLD = 96000
+
+# Coalesce outbound audio into frames of 16 x 960-byte packets (960 bytes
+# = one 20 ms PCM16 packet at 24 kHz mono), so small generator chunks
+# don't each pay a WS frame header and socket write.
+AUDIO_SEND_FRAME_BYTES = 15360
+
+# End-of-utterance detection parameters (PCM16 @ 24 kHz mono)
+VAD_FRAME_BYTES = 960  # one 20 ms frame
+VAD_SILENCE_RMS = 300.0  # frames below this RMS count as silence
+VAD_MIN_SPEECH_BYTES = 12000  # ~250 ms of audio before a turn can trigger
+VAD_TRAILING_SILENCE_FRAMES = 15  # ~300 ms of silence ends the utterance
+
+
+def _frame_rms(frame: bytes) -> float:
+    """Root-mean-square amplitude of one PCM16 frame."""
+    samples = array("h", frame)
+    if not samples:
+        return 0.0
+    return sqrt(sum(s * s for s in samples) / len(samples))
+
+
+class EnergyVAD:
+    """
+    Lightweight energy-based end-of-utterance detector.
+
+    Tracks per-frame RMS of the incoming PCM16 stream: an utterance is
+    considered finished once real speech has been heard and ~300 ms of
+    trailing silence follows it, so responses start when the student
+    stops talking instead of at a fixed two-second byte boundary. A model
+    VAD (e.g. Silero) would be more robust but would pull an ONNX runtime
+    into a backend whose inference is otherwise fully API-hosted.
+    """
+
+    __slots__ = ("_silence_frames", "_heard_speech")
+
+    def __init__(self) -> None:
+        self._silence_frames = 0
+        self._heard_speech = False
+
+    def feed(self, chunk: bytes) -> None:
+        """Update speech/silence tracking with a new PCM16 chunk."""
+        for offset in range(0, len(chunk) - VAD_FRAME_BYTES + 1, VAD_FRAME_BYTES):
+            if _frame_rms(chunk[offset : offset + VAD_FRAME_BYTES]) >= VAD_SILENCE_RMS:
+                self._heard_speech = True
+                self._silence_frames = 0
+            else:
+                self._silence_frames += 1
+
+    @property
+    def utterance_ended(self) -> bool:
+        """True once speech was heard and trailing silence has lasted long enough."""
+        return (
+            self._heard_speech
+            and self._silence_frames >= VAD_TRAILING_SILENCE_FRAMES
+        )
+
+    def reset(self) -> None:
+        """Start tracking a fresh utterance."""
+        self._silence_frames = 0
+        self._heard_speech = False
+
+
+class AudioRing:
+    """
+    Fixed-size single-producer/single-consumer ring for session audio.
+
+    The websocket receive loop is the only writer and
+    process_audio_and_respond the only reader, so no locking is needed.
+    One power-of-two buffer is allocated per session up front; appends
+    wrap with at most two slice copies instead of growing a bytearray
+    per 20 ms frame, and memory stays bounded for the session's life.
+    """
+
+    __slots__ = ("_buf", "_spare", "_mask", "_read", "_write")
+
+    SIZE = 1 << 17  # 128 KiB, comfortably above the processing threshold
+
+    def __init__(self) -> None:
+        self._buf = bytearray(self.SIZE)
+        # Second preallocated buffer for ping-pong draining: drain() hands
+        # out a view of the active buffer and swaps this one in, so the
+        # producer never writes into memory the consumer still holds.
+        self._spare = bytearray(self.SIZE)
+        self._mask = self.SIZE - 1
+        self._read = 0
+        self._write = 0
+
+    def __len__(self) -> int:
+        return self._write - self._read
+
+    def append(self, data: bytes) -> None:
+        """Write a chunk, dropping the oldest audio if the ring is full."""
+        n = len(data)
+        if n >= self.SIZE:
+            # Keep only the most recent window of an oversized chunk
+            data = data[-self.SIZE :]
+            n = len(data)
+        overflow = len(self) + n - self.SIZE
+        if overflow > 0:
+            self._read += overflow
+        pos = self._write & self._mask
+        first = min(n, self.SIZE - pos)
+        self._buf[pos : pos + first] = data[:first]
+        if first < n:
+            self._buf[0 : n - first] = data[first:]
+        self._write += n
+
+    def drain(self) -> bytes | memoryview:
+        """
+        Return and consume all buffered audio.
+
+        The common (non-wrapped) case is zero-copy: a memoryview over the
+        current buffer is returned and the spare buffer is swapped in for
+        subsequent writes. The view stays valid until the drain after
+        next, which is safe because processing of a drained window always
+        completes before the next one is drained. Only a wrapped window
+        pays a copy to linearize the two segments.
+        """
+        n = len(self)
+        if n == 0:
+            return b""
+        pos = self._read & self._mask
+        first = min(n, self.SIZE - pos)
+        if first == n:
+            out: bytes | memoryview = memoryview(self._buf)[pos : pos + n]
+            self._buf, self._spare = self._spare, self._buf
+        else:
+            joined = bytearray(n)
+            joined[:first] = self._buf[pos:]
+            joined[first:] = self._buf[: n - first]
+            out = bytes(joined)
+        self._read = 0
+        self._write = 0
+        return out
+
 
 class VoiceStreamManager:
     """
@@ -95,8 +269,10 @@ class VoiceStreamManager:
         self._student_sessions: dict[str, str] = {}  # student_code -> session_id mapping
         self._lock = asyncio.Lock()
         self._llm_driver = get_llm_driver()
-        self._audio_buffers: dict[str, bytearray] = {}  # Session ID -> audio buffer
+        self._audio_buffers: dict[str, AudioRing] = {}  # Session ID -> audio ring
+        self._vads: dict[str, EnergyVAD] = {}  # Session ID -> utterance detector
         self._processing_tasks: dict[str, asyncio.Task] = {}  # Track ongoing processing
+        self._reaper: asyncio.Task | None = None  # Shared disconnected-session reaper
 
     async def create_session(self, student_code: str, websocket: WebSocket) -> SessionState:
         """Create a new oracy session for a student, or recover existing session."""
@@ -108,16 +284,18 @@ class VoiceStreamManager:
                     # Recover the session
                     state = self._disconnected_sessions.pop(existing_session_id)
                     state.is_active = True
-                    state.last_activity = datetime.now(UTC)
+                    state.last_activity = time.monotonic()
                     self.active_sessions[existing_session_id] = state
                     if existing_session_id not in self._audio_buffers:
-                        self._audio_buffers[existing_session_id] = bytearray()
+                        self._audio_buffers[existing_session_id] = AudioRing()
+                    if existing_session_id not in self._vads:
+                        self._vads[existing_session_id] = EnergyVAD()
                     logger.info(f"Recovered session {existing_session_id} for student {student_code}")
                     return state
                 elif existing_session_id in self.active_sessions:
                     # Session still active - just return it (client reconnected quickly)
                     state = self.active_sessions[existing_session_id]
-                    state.last_activity = datetime.now(UTC)
+                    state.last_activity = time.monotonic()
                     logger.info(f"Reconnected to active session {existing_session_id} for student {student_code}")
                     return state
 
@@ -127,10 +305,11 @@ class VoiceStreamManager:
                 session_id=session_id,
                 student_code=student_code,
                 started_at=datetime.now(UTC),
-                last_activity=datetime.now(UTC),
+                last_activity=time.monotonic(),
             )
             self.active_sessions[session_id] = state
-            self._audio_buffers[session_id] = bytearray()
+            self._audio_buffers[session_id] = AudioRing()
+            self._vads[session_id] = EnergyVAD()
             self._student_sessions[student_code] = session_id
             logger.info(f"Created oracy session: {session_id} for student: {student_code}")
             return state
@@ -145,28 +324,44 @@ class VoiceStreamManager:
             state = self.active_sessions.pop(session_id, None)
             if state:
                 state.is_active = False
-                state.last_activity = datetime.now(UTC)
+                state.last_activity = time.monotonic()
                 self._disconnected_sessions[session_id] = state
                 logger.info(f"Session {session_id} disconnected, available for recovery")
 
-                # Schedule cleanup after TTL
-                asyncio.create_task(self._cleanup_disconnected_session(session_id))
+                # One shared reaper handles TTL expiry for all sessions
+                self._ensure_reaper()
 
             return state
 
-    async def _cleanup_disconnected_session(self, session_id: str) -> None:
-        """Remove disconnected session after TTL expires."""
-        await asyncio.sleep(DISCONNECTED_SESSION_TTL_SECONDS)
-        async with self._lock:
-            if session_id in self._disconnected_sessions:
-                state = self._disconnected_sessions.pop(session_id)
-                # Clean up student mapping
-                if state.student_code in self._student_sessions:
-                    if self._student_sessions[state.student_code] == session_id:
+    def _ensure_reaper(self) -> None:
+        """Start the shared reaper task on first use (needs a running loop)."""
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        """
+        Periodically evict disconnected sessions whose TTL has lapsed.
+
+        One periodic scan replaces the previous task-per-disconnect
+        design, where every disconnect spawned a coroutine sleeping for
+        the full TTL and holding session references for five minutes.
+        """
+        while True:
+            await asyncio.sleep(REAP_INTERVAL_SECONDS)
+            now = time.monotonic()
+            async with self._lock:
+                expired = [
+                    session_id
+                    for session_id, state in self._disconnected_sessions.items()
+                    if now - state.last_activity > DISCONNECTED_SESSION_TTL_SECONDS
+                ]
+                for session_id in expired:
+                    state = self._disconnected_sessions.pop(session_id)
+                    if self._student_sessions.get(state.student_code) == session_id:
                         del self._student_sessions[state.student_code]
-                # Clean up audio buffer
-                self._audio_buffers.pop(session_id, None)
-                logger.info(f"Cleaned up expired disconnected session: {session_id}")
+                    self._audio_buffers.pop(session_id, None)
+                    self._vads.pop(session_id, None)
+                    logger.info(f"Cleaned up expired disconnected session: {session_id}")
 
     async def end_session(self, session_id: str) -> SessionState | None:
         """End an active session permanently (no recovery)."""
@@ -181,29 +376,61 @@ class VoiceStreamManager:
                     if self._student_sessions[state.student_code] == session_id:
                         del self._student_sessions[state.student_code]
 
-            # Clean up audio buffer
+            # Clean up audio buffer and utterance detector
             self._audio_buffers.pop(session_id, None)
+            self._vads.pop(session_id, None)
             # Cancel any ongoing processing task
             if session_id in self._processing_tasks:
                 self._processing_tasks[session_id].cancel()
                 del self._processing_tasks[session_id]
             if state:
                 state.is_active = False
+                state.ended_at = datetime.now(UTC)
+                state.duration_seconds = int(
+                    (state.ended_at - state.started_at).total_seconds()
+                )
+                if state.latency_count:
+                    state.avg_latency_ms = state.latency_mean
                 logger.info(f"Ended oracy session: {session_id}")
             return state
 
     async def append_audio(self, session_id: str, audio_chunk: bytes) -> None:
-        """Append audio chunk to session buffer."""
-        if session_id in self._audio_buffers:
-            self._audio_buffers[session_id].extend(audio_chunk)
-
-    async def get_audio_buffer(self, session_id: str) -> bytes:
-        """Get and clear the accumulated audio buffer."""
-        if session_id in self._audio_buffers:
-            audio = bytes(self._audio_buffers[session_id])
-            self._audio_buffers[session_id] = bytearray()
-            return audio
-        return b""
+        """Append audio chunk to the session's ring buffer and feed the VAD."""
+        ring = self._audio_buffers.get(session_id)
+        if ring is not None:
+            ring.append(audio_chunk)
+        vad = self._vads.get(session_id)
+        if vad is not None:
+            vad.feed(audio_chunk)
+
+    def audio_buffered(self, session_id: str) -> int:
+        """Bytes currently buffered for a session."""
+        ring = self._audio_buffers.get(session_id)
+        return len(ring) if ring is not None else 0
+
+    def should_process_audio(self, session_id: str) -> bool:
+        """
+        Whether the buffered audio forms a processable turn.
+
+        Triggers at end of utterance (speech followed by ~300 ms of
+        silence, with a minimum of real audio buffered) so responses
+        start when the student stops talking; the fixed byte threshold
+        remains as a ceiling for continuous speech.
+        """
+        buffered = self.audio_buffered(session_id)
+        if buffered >= AUDIO_PROCESS_THRESHOLD:
+            return True
+        vad = self._vads.get(session_id)
+        return (
+            vad is not None
+            and vad.utterance_ended
+            and buffered >= VAD_MIN_SPEECH_BYTES
+        )
+
+    async def get_audio_buffer(self, session_id: str) -> bytes | memoryview:
+        """Drain the accumulated audio from the session's ring buffer."""
+        ring = self._audio_buffers.get(session_id)
+        return ring.drain() if ring is not None else b""
 
     def get_session_context(self, session_id: str) -> SessionContext | None:
         """Get the session context for LLM processing."""
@@ -211,17 +438,12 @@ class VoiceStreamManager:
         if not state:
             return None
 
-        history = [
-            ConversationTurn(role=turn["role"], content=turn["content"])
-            for turn in state.conversation_history
-        ]
-
         return SessionContext(
             student_code=state.student_code,
             grade=state.student_grade,
             primary_language=state.student_language,
             curriculum_outcome=state.curriculum_outcome,
-            conversation_history=history,
+            conversation_history=state.turns,
         )
 
     async def process_audio_and_respond(
@@ -242,6 +464,9 @@ class VoiceStreamManager:
 
         # Get accumulated audio
         audio_data = await self.get_audio_buffer(session_id)
+        vad = self._vads.get(session_id)
+        if vad is not None:
+            vad.reset()
         if len(audio_data) < 1000:  # Minimum audio threshold (very short)
             logger.debug(f"Audio buffer too small ({len(audio_data)} bytes), skipping")
             return
@@ -252,36 +477,40 @@ class VoiceStreamManager:
             return
 
         try:
-            # First, transcribe the audio to get text (for logging and response)
-            transcript = await self._llm_driver.transcribe_audio(audio_data)
-            if transcript:
-                # Send transcript to client
-                await send_json_message(
-                    websocket,
-                    MessageType.TRANSCRIPT,
-                    {"text": scrub_pii(transcript)},
-                )
-                # Add to conversation history
-                await self.add_conversation_turn(session_id, "user", scrub_pii(transcript))
-
-            # Generate audio response from LLM
-            response_chunks = []
-            async for audio_chunk in self._llm_driver.generate_audio_response(audio_data, context):
-                if audio_chunk:
-                    # Send audio chunk as binary to client
-                    await websocket.send_bytes(audio_chunk)
-                    response_chunks.append(audio_chunk)
+            # One fused stream yields both the input transcript and the
+            # response audio, so the same audio is not sent through ASR
+            # and generation separately. Audio chunks batch into full
+            # frames before hitting the socket.
+            pending = bytearray()
+            async for kind, item in self._llm_driver.generate_audio_and_transcript(
+                audio_data, context
+            ):
+                if kind == "transcript" and item:
+                    # Scrub once, in a worker thread: the regex passes
+                    # would otherwise stall the event loop for every turn
+                    clean_transcript = await asyncio.to_thread(scrub_pii, item)
+                    await send_json_message(
+                        websocket,
+                        MessageType.TRANSCRIPT,
+                        {"text": clean_transcript},
+                    )
+                    await self.add_conversation_turn(
+                        session_id, "user", clean_transcript
+                    )
+                elif kind == "audio" and item:
+                    pending.extend(item)
+                    if len(pending) >= AUDIO_SEND_FRAME_BYTES:
+                        await websocket.send_bytes(bytes(pending))
+                        pending.clear()
+            if pending:
+                await websocket.send_bytes(bytes(pending))
 
             # Calculate latency
             latency_ms = (time.perf_counter() - start_time) * 1000
             await self.record_turn(session_id, latency_ms)
 
             # Send latency update
-            await send_json_message(
-                websocket,
-                MessageType.LATENCY_UPDATE,
-                {"latency_ms": round(latency_ms, 2)},
-            )
+            await send_latency_update(websocket, latency_ms)
 
             logger.info(f"Processed audio response in {latency_ms:.0f}ms for session {session_id}")
 
@@ -294,11 +523,20 @@ class VoiceStreamManager:
         return self.active_sessions.get(session_id)
 
     async def record_turn(self, session_id: str, latency_ms: float) -> None:
-        """Record a conversation turn with its latency."""
-        async with self._lock:
-            if session_id in self.active_sessions:
-                self.active_sessions[session_id].turn_count += 1
-                self.active_sessions[session_id].latencies.append(latency_ms)
+        """
+        Record a conversation turn with its latency.
+
+        No lock: each session's state is only touched by its own websocket
+        coroutine, and list.append / int increment don't yield, so the
+        manager lock only serialized unrelated sessions here. It remains
+        for the shared session-registry dict mutations.
+        """
+        state = self.active_sessions.get(session_id)
+        if state is not None:
+            state.turn_count += 1
+            n = state.latency_count + 1
+            state.latency_mean += (latency_ms - state.latency_mean) / n
+            state.latency_count = n
 
     async def add_conversation_turn(
         self,
@@ -306,13 +544,14 @@ class VoiceStreamManager:
         role: str,
         content: str,
     ) -> None:
-        """Add a turn to the conversation history."""
-        async with self._lock:
-            if session_id in self.active_sessions:
-                self.active_sessions[session_id].conversation_history.append({
-                    "role": role,
-                    "content": content,
-                })
+        """Add a turn to the conversation history (lock-free, see record_turn)."""
+        state = self.active_sessions.get(session_id)
+        if state is not None:
+            state.conversation_history.append({
+                "role": role,
+                "content": content,
+            })
+            state.turns.append(ConversationTurn(role=role, content=content))
 
     async def get_ai_response(
         self,
@@ -329,19 +568,13 @@ class VoiceStreamManager:
         if not state:
             return "Session not found.", 0.0
 
-        # Build conversation history for context
-        history = [
-            ConversationTurn(role=turn["role"], content=turn["content"])
-            for turn in state.conversation_history
-        ]
-
-        # Create session context
+        # Create session context over the maintained turn list
         context = SessionContext(
             student_code=state.student_code,
             grade=state.student_grade,
             primary_language=state.student_language,
             curriculum_outcome=state.curriculum_outcome,
-            conversation_history=history,
+            conversation_history=state.turns,
         )
 
         # Generate response and measure latency
@@ -371,17 +604,41 @@ class VoiceStreamManager:
 session_manager = VoiceStreamManager()
 
 
-async def get_or_create_student(db: AsyncSession, student_code: str) -> Student | None:
-    """Fetch student by code, or return None if not found."""
+@functools.lru_cache(maxsize=16)
+def default_curriculum_for_grade(grade: int) -> str | None:
+    """
+    Default curriculum outcome for a new session, memoized per grade.
+
+    Every session opens with the same "conversation practice" query, so
+    the store search runs once per grade per process instead of per
+    connection. Store failures propagate — lru_cache does not memoize
+    exceptions — so a transient failure is retried on the next session
+    instead of pinning the grade to no-context until restart; only a
+    genuine no-match result is cached as None.
+    """
+    store = get_curriculum_store()
+    matches = store.search("conversation practice", grade_filter=grade, top_k=1)
+    return matches[0].outcome_text if matches else None
+
+
+async def get_or_create_student(db: AsyncSession, student_code: str) -> Row | None:
+    """
+    Fetch the student columns a session needs, or None if not found.
+
+    Only id/grade/primary_language are ever read, so a tuple load skips
+    full-entity hydration and identity-map tracking on every connect.
+    """
     result = await db.execute(
-        select(Student).where(Student.student_code == student_code)
+        select(Student.id, Student.grade, Student.primary_language).where(
+            Student.student_code == student_code
+        )
     )
-    return result.scalar_one_or_none()
+    return result.first()
 
 
 async def update_session_with_student_context(
     session_state: SessionState,
-    student: Student,
+    student: Row,
 ) -> None:
     """Update session state with student context from database."""
     session_state.student_id = student.id
@@ -402,8 +659,11 @@ async def create_oracy_session_record(
         started_at=session_state.started_at,
     )
     db.add(oracy_session)
+    # No refresh: the caller never reads server-generated columns, and the
+    # extra SELECT sat on the connect critical path before the student
+    # could speak. The commit itself stays so the session row exists for
+    # report linkage even if the process dies mid-session.
     await db.commit()
-    await db.refresh(oracy_session)
     return oracy_session
 
 
@@ -412,34 +672,70 @@ async def finalize_oracy_session(
     session_state: SessionState,
     transcript_summary: str | None = None,
 ) -> None:
-    """Update the oracy session record with final statistics."""
-    result = await db.execute(
-        select(OracySession).where(OracySession.id == session_state.session_id)
+    """
+    Update the oracy session record with final statistics.
+
+    A single UPDATE keyed by the session id: loading the ORM entity first
+    just to mutate scalar columns cost an extra SELECT round-trip per
+    session end.
+    """
+    # Stats were computed once in end_session; fall back to computing here
+    # only if the session record is finalized without a prior end_session.
+    ended_at = session_state.ended_at or datetime.now(UTC)
+    duration = session_state.duration_seconds
+    if duration is None:
+        duration = int((ended_at - session_state.started_at).total_seconds())
+
+    values: dict[str, Any] = {
+        "status": SessionStatus.COMPLETED,
+        "ended_at": ended_at,
+        "turn_count": session_state.turn_count,
+        "duration_seconds": duration,
+    }
+    if session_state.avg_latency_ms is not None:
+        values["avg_response_latency_ms"] = session_state.avg_latency_ms
+    elif session_state.latency_count:
+        values["avg_response_latency_ms"] = session_state.latency_mean
+    if transcript_summary:
+        # Scrub PII before storing
+        values["transcript_summary"] = scrub_pii(transcript_summary)
+
+    await db.execute(
+        update(OracySession)
+        .where(OracySession.id == session_state.session_id)
+        .values(**values)
     )
-    oracy_session = result.scalar_one_or_none()
-
-    if oracy_session:
-        oracy_session.status = SessionStatus.COMPLETED
-        oracy_session.ended_at = datetime.now(UTC)
-        oracy_session.turn_count = session_state.turn_count
-        oracy_session.duration_seconds = int(
-            (datetime.now(UTC) - session_state.started_at).total_seconds()
-        )
-        if session_state.latencies:
-            oracy_session.avg_response_latency_ms = sum(session_state.latencies) / len(
-                session_state.latencies
-            )
-        if transcript_summary:
-            # Scrub PII before storing
-            oracy_session.transcript_summary = scrub_pii(transcript_summary)
+    await db.commit()
 
-        await db.commit()
+
+def build_transcript_summary(state: SessionState) -> str | None:
+    """
+    Render the trailing conversation turns as the transcript summary.
+
+    Derived from conversation_history at finalize time instead of being
+    accumulated in a parallel per-turn string list, which duplicated the
+    whole conversation in memory (and missed the audio-transcript turns,
+    which only ever reached the history).
+    """
+    if not state.conversation_history:
+        return None
+    recent = state.conversation_history[-TRANSCRIPT_SUMMARY_MAX_TURNS:]
+    return "\n".join(
+        f"{SPEAKER_LABELS.get(turn['role'], turn['role'])}: {turn['content']}"
+        for turn in recent
+    )
 
 
 async def send_json_message(websocket: WebSocket, msg_type: MessageType, data: dict[str, Any]) -> None:
-    """Send a JSON message to the client."""
-    message = {"type": msg_type.value, "data": data}
-    await websocket.send_json(message)
+    """
+    Send a JSON message to the client.
+
+    Serialized with orjson (C extension) instead of send_json's stdlib
+    encoder. Control messages stay text frames: the protocol reserves
+    binary frames for PCM audio.
+    """
+    payload = orjson.dumps({"type": msg_type.value, "data": data})
+    await websocket.send_text(payload.decode())
 
 
 async def send_error(websocket: WebSocket, error: str) -> None:
@@ -447,32 +743,49 @@ async def send_error(websocket: WebSocket, error: str) -> None:
     await send_json_message(websocket, MessageType.ERROR, {"error": error})
 
 
+# Pre-encoded envelope for the per-turn latency message: the structure
+# never varies, so only the number is spliced in and no JSON serializer
+# runs on the per-turn send. Envelopes with free-form string fields
+# (ready/ended/error) keep going through orjson for correct escaping.
+_LATENCY_UPDATE_TPL = '{"type":"latency_update","data":{"latency_ms":%.2f}}'
+
+
+async def send_latency_update(websocket: WebSocket, latency_ms: float) -> None:
+    """Send the per-turn latency message from the pre-encoded template."""
+    await websocket.send_text(_LATENCY_UPDATE_TPL % latency_ms)
+
+
 @router.websocket("/ws/oracy/{student_code}")
-async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
+async def oracy_voice_stream(
+    websocket: WebSocket,
+    student_code: str,
+    legacy: bool = Query(False, description="Accept base64 audio in JSON frames"),
+) -> None:
     """
     WebSocket endpoint for real-time voice streaming.
 
     Protocol:
     1. Client connects with student_code
     2. Server validates student and creates session
-    3. Client sends audio chunks (binary or base64)
+    3. Client sends audio chunks as binary WebSocket frames
     4. Server processes audio, returns AI response audio
     5. Session ends on disconnect or explicit end message
 
-    Message Format (JSON):
+    Message Format (JSON, control only):
     {
-        "type": "audio_chunk" | "session_start" | "session_end" | "user_message",
+        "type": "session_start" | "session_end" | "user_message",
         "data": { ... }
     }
 
     Audio Format:
     - PCM 16-bit signed, 24kHz mono
-    - Sent as binary WebSocket frames or base64-encoded in JSON
+    - Sent as binary WebSocket frames. Base64-in-JSON audio_chunk
+      messages inflate payloads ~33% and cost a decode per frame; they
+      are only accepted when the client connects with ?legacy=1.
     """
     await websocket.accept()
 
     session_state: SessionState | None = None
-    transcript_buffer: list[str] = []
 
     try:
         # Create session
@@ -485,11 +798,14 @@ async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
                 await update_session_with_student_context(session_state, student)
                 await create_oracy_session_record(db, student.id, session_state)
 
-                # Try to get relevant curriculum context
-                curriculum = session_manager.get_relevant_curriculum(
-                    session_state.student_grade,
-                    "conversation practice",  # Default topic
-                )
+                # Try to get relevant curriculum context (memoized per grade)
+                try:
+                    curriculum = default_curriculum_for_grade(
+                        session_state.student_grade
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to fetch curriculum context: {e}")
+                    curriculum = None
                 if curriculum:
                     session_state.curriculum_outcome = curriculum
             else:
@@ -511,7 +827,28 @@ async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
             # Receive message (can be text JSON or binary audio)
             message = await websocket.receive()
 
-            if "text" in message:
+            # Binary audio frames are the hot path: test for them first so
+            # every ~20 ms packet skips the JSON branch entirely. A dual
+            # iter_bytes()/iter_text() consumer pair was considered and
+            # rejected - Starlette forbids concurrent receive() calls on a
+            # single connection, so the loop stays fused.
+            if "bytes" in message:
+                # Binary audio chunk - accumulate in the session ring
+                audio_bytes = message["bytes"]
+                logger.debug(f"Received {len(audio_bytes)} bytes of audio")
+
+                await session_manager.append_audio(session_state.session_id, audio_bytes)
+
+                # Respond at end of utterance (energy VAD), with the byte
+                # ceiling as a safety net for continuous speech
+                if session_manager.should_process_audio(session_state.session_id):
+                    # Process the audio and send response
+                    await session_manager.process_audio_and_respond(
+                        session_state.session_id,
+                        websocket,
+                    )
+
+            elif "text" in message:
                 # JSON message
                 try:
                     data = json.loads(message["text"])
@@ -522,31 +859,35 @@ async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
                         break
 
                     elif msg_type == MessageType.AUDIO_CHUNK.value:
-                        # Process audio chunk (base64 encoded in JSON)
+                        # Base64-wrapped audio is legacy-only; all PCM should
+                        # arrive as binary frames
+                        if not legacy:
+                            logger.warning(
+                                "Rejected base64 audio_chunk (connect with "
+                                "?legacy=1 or send binary frames)"
+                            )
+                            await send_error(
+                                websocket, "Send audio as binary WebSocket frames"
+                            )
+                            continue
+
                         audio_b64 = payload.get("audio", "")
                         if audio_b64:
                             try:
-                                audio_bytes = base64.b64decode(audio_b64)
-                                # Append to buffer
+                                # binascii.a2b_base64 is the C fast path
+                                audio_bytes = binascii.a2b_base64(audio_b64)
                                 await session_manager.append_audio(
                                     session_state.session_id, audio_bytes
                                 )
 
-                                # Check buffer size and process if threshold reached
-                                buffer = await session_manager.get_audio_buffer(
+                                # Respond at end of utterance (energy VAD)
+                                if session_manager.should_process_audio(
                                     session_state.session_id
-                                )
-                                if len(buffer) > 0:
-                                    # Re-add buffer (peek behavior)
-                                    await session_manager.append_audio(
-                                        session_state.session_id, buffer
+                                ):
+                                    await session_manager.process_audio_and_respond(
+                                        session_state.session_id,
+                                        websocket,
                                     )
-                                    # Process when we have ~2 seconds of audio
-                                    if len(buffer) >= 96000:
-                                        await session_manager.process_audio_and_respond(
-                                            session_state.session_id,
-                                            websocket,
-                                        )
                             except Exception as e:
                                 logger.error(f"Error decoding audio: {e}")
                                 await send_error(websocket, "Invalid audio data")
@@ -555,16 +896,15 @@ async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
                         # Text message (for testing without audio)
                         user_text = payload.get("text", "")
 
-                        # Scrub PII before processing
-                        clean_text = scrub_pii(user_text)
-                        transcript_buffer.append(f"Student: {clean_text}")
+                        # Scrub PII before processing (worker thread: keeps
+                        # the regex passes off the receive loop)
+                        clean_text = await asyncio.to_thread(scrub_pii, user_text)
 
                         # Get AI response from LLM driver
                         ai_response, latency_ms = await session_manager.get_ai_response(
                             session_state.session_id,
                             clean_text,
                         )
-                        transcript_buffer.append(f"NEXUS: {ai_response}")
 
                         await send_json_message(
                             websocket,
@@ -578,44 +918,11 @@ async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
                         )
 
                         # Send latency update to client
-                        await send_json_message(
-                            websocket,
-                            MessageType.LATENCY_UPDATE,
-                            {"latency_ms": round(latency_ms, 2)},
-                        )
+                        await send_latency_update(websocket, latency_ms)
 
                 except json.JSONDecodeError:
                     await send_error(websocket, "Invalid JSON message")
 
-            elif "bytes" in message:
-                # Binary audio chunk - accumulate in buffer
-                audio_bytes = message["bytes"]
-                logger.debug(f"Received {len(audio_bytes)} bytes of audio")
-
-                # Append to audio buffer
-                await session_manager.append_audio(session_state.session_id, audio_bytes)
-
-                # Check if we should process (simple heuristic: buffer size > threshold)
-                # A proper implementation would use Voice Activity Detection (VAD)
-                buffer = await session_manager.get_audio_buffer(session_state.session_id)
-                if len(buffer) == 0:
-                    # Buffer was just cleared, likely being processed
-                    continue
-
-                # Re-add the buffer since we just retrieved it (peek behavior)
-                await session_manager.append_audio(session_state.session_id, buffer)
-
-                # Process when we have enough audio (about 2 seconds at 24kHz mono 16-bit)
-                # 24000 samples/sec * 2 bytes/sample * 2 sec = 96000 bytes
-                AUDIO_PROCESS_THRESHOLD = 96000
-
-                if len(buffer) >= AUDIO_PROCESS_THRESHOLD:
-                    # Process the audio and send response
-                    await session_manager.process_audio_and_respond(
-                        session_state.session_id,
-                        websocket,
-                    )
-
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for session: {session_state.session_id if session_state else 'unknown'}")
         # Mark as disconnected (allows recovery) rather than ending
@@ -638,19 +945,23 @@ async def oracy_voice_stream(websocket: WebSocket, student_code: str) -> None:
             # Save session to database
             if final_state and final_state.student_id:
                 async with async_session_factory() as db:
-                    transcript_summary = "\n".join(transcript_buffer) if transcript_buffer else None
+                    transcript_summary = build_transcript_summary(final_state)
                     await finalize_oracy_session(db, final_state, transcript_summary)
 
-            # Send session ended message
+            # Send session ended message, reusing the stats end_session
+            # computed rather than re-deriving them
+            duration = session_state.duration_seconds
+            if duration is None:
+                duration = int(
+                    (datetime.now(UTC) - session_state.started_at).total_seconds()
+                )
             try:
                 await send_json_message(
                     websocket,
                     MessageType.SESSION_ENDED,
                     {
                         "session_id": session_state.session_id,
-                        "duration_seconds": int(
-                            (datetime.now(UTC) - session_state.started_at).total_seconds()
-                        ),
+                        "duration_seconds": duration,
                         "turn_count": session_state.turn_count,
                     },
                 )
@@ -1,35 +1,40 @@
 """Core module exports."""
 
-from app.core.config import get_settings, settings
-from app.core.database import Base, close_db, get_db, get_db_context, init_db
-from app.core.privacy_guard import (
-    PIIPattern,
-    PIIPlaceholder,
-    PrivacyGuardMiddleware,
-    PrivacyViolationError,
-    contains_pii,
-    create_privacy_guard_middleware,
-    scrub_dict,
-    scrub_pii,
-)
+from importlib import import_module
+from typing import Any
 
-__all__ = [
+# Lazy re-exports (PEP 562): importing app.core for one helper must not
+# construct Settings or the database engine as an import side effect.
+_EXPORTS = {
     # Config
-    "settings",
-    "get_settings",
+    "settings": "app.core.config",
+    "get_settings": "app.core.config",
     # Database
-    "Base",
-    "get_db",
-    "get_db_context",
-    "init_db",
-    "close_db",
+    "Base": "app.core.database",
+    "get_db": "app.core.database",
+    "get_db_context": "app.core.database",
+    "init_db": "app.core.database",
+    "close_db": "app.core.database",
     # Privacy
-    "scrub_pii",
-    "scrub_dict",
-    "contains_pii",
-    "PIIPattern",
-    "PIIPlaceholder",
-    "PrivacyViolationError",
-    "PrivacyGuardMiddleware",
-    "create_privacy_guard_middleware",
-]
+    "scrub_pii": "app.core.privacy_guard",
+    "scrub_dict": "app.core.privacy_guard",
+    "contains_pii": "app.core.privacy_guard",
+    "PIIPattern": "app.core.privacy_guard",
+    "PIIPlaceholder": "app.core.privacy_guard",
+    "PrivacyViolationError": "app.core.privacy_guard",
+    "PrivacyGuardMiddleware": "app.core.privacy_guard",
+    "create_privacy_guard_middleware": "app.core.privacy_guard",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve re-exported names on first access."""
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    return getattr(import_module(module_name), name)
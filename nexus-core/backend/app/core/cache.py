@@ -0,0 +1,54 @@
+"""
+Small in-process TTL cache for hot read paths.
+
+The deployment runs a single backend instance with no external cache in
+the stack, so a bounded dict with monotonic-clock expiry gives the same
+read-shedding as a Redis layer without the extra hop. If the backend is
+ever scaled horizontally, swap the storage here for a shared cache and
+the call sites stay unchanged.
+"""
+
+import time
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping cache with per-entry time-to-live."""
+
+    def __init__(self, ttl_seconds: float, max_size: int = 1024) -> None:
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._entries: dict[K, tuple[V, float]] = {}
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, deadline = entry
+        if time.monotonic() >= deadline:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting expired entries when full."""
+        if len(self._entries) >= self._max_size:
+            now = time.monotonic()
+            expired = [k for k, (_, d) in self._entries.items() if d <= now]
+            for k in expired:
+                del self._entries[k]
+            if len(self._entries) >= self._max_size:
+                self._entries.clear()
+        self._entries[key] = (value, time.monotonic() + self._ttl)
+
+    def invalidate(self, key: K) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
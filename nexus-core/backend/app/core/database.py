@@ -4,6 +4,8 @@ Database connection and session management for NEXUS.
 Uses SQLAlchemy 2.0 async patterns with asyncpg driver.
 """
 
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -12,6 +14,8 @@ from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
@@ -19,15 +23,28 @@ class Base(DeclarativeBase):
     pass
 
 
-# Create async engine
+# Create async engine. The enlarged prepared-statement cache keeps the
+# recurring analytics/auth statements prepared on each pooled connection,
+# so repeat executions skip parse/plan and use asyncpg's binary row codecs.
+# query_cache_size is the SQLAlchemy-side compiled-SQL cache; the analytics
+# endpoints emit many structural variants (filter combinations, CTEs), so
+# the default 500 can thrash under a full dashboard load.
 engine = create_async_engine(
     str(settings.database_url),
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    query_cache_size=1200,
+    connect_args={"prepared_statement_cache_size": 1024},
 )
 
+# A mis-selected pool class under asyncpg either serializes all queries or
+# deadlocks the app outright; fail at import rather than under load.
+assert (
+    engine.pool.__class__.__name__ == "AsyncAdaptedQueuePool"
+), f"Expected AsyncAdaptedQueuePool, got {engine.pool.__class__.__name__}"
+
 # Session factory
 async_session_factory = async_sessionmaker(
     engine,
@@ -42,6 +59,11 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for FastAPI routes to get a database session.
 
+    Write endpoints commit explicitly; read-only requests therefore skip
+    the COMMIT round-trip that an implicit commit-on-exit would issue.
+    Handles rollback and cleanup automatically. This is the single
+    implementation — app.api.deps re-exports it.
+
     Yields:
         AsyncSession: The database session.
 
@@ -53,7 +75,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -66,7 +87,9 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
     """
     Context manager for getting a database session outside of FastAPI.
 
-    Useful for scripts, background tasks, or testing.
+    Useful for scripts, background tasks, or testing. Unlike get_db,
+    this commits on successful exit — script-style callers mutate and
+    rely on the wrapper to persist.
 
     Example:
         async with get_db_context() as db:
@@ -94,6 +117,26 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_pool() -> None:
+    """
+    Open pool_size connections before serving traffic.
+
+    Without pre-warming, the first burst of requests each pays TCP + TLS +
+    auth connection setup; holding the connections open once at startup
+    fills the pool so early traffic checks out warm connections.
+    """
+    connections = []
+    try:
+        connections = await asyncio.gather(
+            *(engine.connect() for _ in range(settings.db_pool_size))
+        )
+    except Exception as exc:  # pragma: no cover - depends on DB availability
+        logger.warning(f"Pool pre-warm incomplete: {exc}")
+    finally:
+        for conn in connections:
+            await conn.close()
+
+
 async def close_db() -> None:
     """
     Close database connections.
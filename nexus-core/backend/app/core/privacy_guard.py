@@ -7,73 +7,151 @@ must be scrubbed of Personally Identifiable Information (PII) before
 logging or sending to external LLM providers.
 
 CRITICAL: This middleware is the first line of defense for FOIP compliance.
+
+Pattern repetitions are intentionally bounded (name word counts, address
+token counts) so attacker-controlled bodies cannot drive the matcher into
+deep backtracking; sequences beyond the bounds are treated as prose, not
+PII. This is a deliberate truncation of the matched classes.
 """
 
 import re
+import sys
+from collections import deque
 from collections.abc import Callable
 from typing import Any
 
+import orjson
+
+# PII scanning runs on every request body, which makes the regex engine a
+# ReDoS surface: the NAME/ADDRESS shapes carry nested quantifiers that a
+# backtracking engine can blow up on adversarial input. With google-re2
+# installed (poetry extra "re2"), patterns compile to RE2's guaranteed
+# linear-time engine; otherwise the stdlib engine is used. Every pattern
+# in this module is pure-regular (no backreferences or lookarounds), so
+# both engines accept them unchanged.
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message
+
+# Pattern sources, shared by the per-class compiled patterns and the
+# combined single-pass scrubber below.
+
+# Email addresses
+_EMAIL_SRC = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+
+# Phone numbers (North American format with variations, including 7-digit local)
+_PHONE_SRC = r"(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}|\b\d{3}[-.\s]?\d{4}\b"
+
+# Names (basic pattern - capitalized word pairs)
+# Note: This is intentionally broad to catch potential names. Repetitions
+# are bounded to realistic name shapes (2-5 words of up to ~30 letters):
+# unbounded nesting here is what gives backtracking engines quadratic
+# blowup on adversarial "Aa Aa Aa ..." input, and longer sequences are
+# prose, not names.
+_NAME_SRC = r"\b[A-Z][a-z]{1,30}(?:\s+[A-Z][a-z]{1,30}){1,4}\b"
+
+# Social Insurance Numbers (Canadian SIN)
+_SIN_SRC = r"\b\d{3}[-\s]?\d{3}[-\s]?\d{3}\b"
+
+# Student/ID numbers (generic numeric IDs)
+_STUDENT_ID_SRC = r"\b(?:student|id|#)[-:\s]*\d{5,10}\b"
+
+# Addresses (basic street address pattern). House numbers and street-name
+# words are bounded like NAME above: civic numbers max six digits, street
+# names at most five words of up to 20 letters before the suffix.
+_ADDRESS_SRC = (
+    r"\b\d{1,6}\s+[A-Za-z]{1,20}(?:\s+[A-Za-z]{1,20}){0,4}\s+"
+    r"(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Court|Ct)\b"
+)
 
 
 class PIIPattern:
     """Compiled regex patterns for PII detection."""
 
-    # Email addresses
-    EMAIL = re.compile(
-        r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-        re.IGNORECASE,
-    )
-
-    # Phone numbers (North American format with variations, including 7-digit local)
-    PHONE = re.compile(
-        r"(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}|\b\d{3}[-.\s]?\d{4}\b",
-    )
-
-    # Names (basic pattern - capitalized word pairs)
-    # Note: This is intentionally broad to catch potential names
-    NAME = re.compile(
-        r"\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+\b",
-    )
-
-    # Social Insurance Numbers (Canadian SIN)
-    SIN = re.compile(
-        r"\b\d{3}[-\s]?\d{3}[-\s]?\d{3}\b",
-    )
-
-    # Student/ID numbers (generic numeric IDs)
-    STUDENT_ID = re.compile(
-        r"\b(?:student|id|#)[-:\s]*\d{5,10}\b",
-        re.IGNORECASE,
-    )
-
-    # Addresses (basic street address pattern)
-    ADDRESS = re.compile(
-        r"\b\d+\s+[A-Za-z]+(?:\s+[A-Za-z]+)*\s+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Boulevard|Blvd|Lane|Ln|Way|Court|Ct)\b",
-        re.IGNORECASE,
-    )
+    EMAIL = _regex.compile(_EMAIL_SRC, re.IGNORECASE)
+    PHONE = _regex.compile(_PHONE_SRC)
+    NAME = _regex.compile(_NAME_SRC)
+    SIN = _regex.compile(_SIN_SRC)
+    STUDENT_ID = _regex.compile(_STUDENT_ID_SRC, re.IGNORECASE)
+    ADDRESS = _regex.compile(_ADDRESS_SRC, re.IGNORECASE)
+
+
+# Single-pass scrubber: one alternation over every PII class. Branches
+# keep the former pass order so ties at the same start position resolve
+# identically, but overlap resolution is NOT equivalent to the old
+# sequential passes: an alternation is position-first (the leftmost match
+# of any class wins, then branch order breaks ties), where the old code
+# was class-first globally. Example: "John Smith@x.com" now scrubs to
+# "<NAME>@x.com" where the EMAIL-first sequential passes produced
+# "John <EMAIL>". Both fully remove the PII; only which class claims the
+# overlapping characters moved, and TestOverlapPrecedence pins the
+# chosen behavior. Case-insensitivity is scoped per branch with (?i:...)
+# so NAME/SIN/PHONE keep their case-sensitive semantics.
+_SCRUB_BRANCHES = (
+    ("EMAIL", f"(?i:{_EMAIL_SRC})"),
+    ("STUDENT_ID", f"(?i:{_STUDENT_ID_SRC})"),
+    ("SIN", _SIN_SRC),
+    ("PHONE", _PHONE_SRC),
+    ("ADDRESS", f"(?i:{_ADDRESS_SRC})"),
+    ("NAME", _NAME_SRC),
+)
+
+_COMBINED_PATTERN = _regex.compile(
+    "|".join(f"(?P<{name}>{source})" for name, source in _SCRUB_BRANCHES)
+)
+
+# Anchor prefilter: no PII class can match text lacking all of '@'
+# (EMAIL), a digit (PHONE/SIN/STUDENT_ID/ADDRESS) and an uppercase letter
+# (NAME). Most payload strings are clean — uuids aside, lowercase prose,
+# enum values — so one character-class scan lets them skip the combined
+# automaton entirely. Three character classes need no Aho-Corasick
+# machinery; a single-class regex scan is already a memchr-style pass.
+_ANCHOR_PATTERN = _regex.compile(r"[@0-9A-Z]")
 
 
 class PIIPlaceholder:
-    """Replacement placeholders for scrubbed PII."""
+    """Replacement placeholders for scrubbed PII (interned: the same six
+    strings are emitted thousands of times per minute under load, and
+    interning keeps downstream equality checks pointer-cheap)."""
+
+    EMAIL = sys.intern("<EMAIL>")
+    PHONE = sys.intern("<PHONE>")
+    NAME = sys.intern("<NAME>")
+    SIN = sys.intern("<SIN>")
+    STUDENT_ID = sys.intern("<STUDENT_ID>")
+    ADDRESS = sys.intern("<ADDRESS>")
+
+
+# Placeholder lookup keyed by the combined pattern's group names.
+_PLACEHOLDERS = {
+    "EMAIL": PIIPlaceholder.EMAIL,
+    "STUDENT_ID": PIIPlaceholder.STUDENT_ID,
+    "SIN": PIIPlaceholder.SIN,
+    "PHONE": PIIPlaceholder.PHONE,
+    "ADDRESS": PIIPlaceholder.ADDRESS,
+    "NAME": PIIPlaceholder.NAME,
+}
 
-    EMAIL = "<EMAIL>"
-    PHONE = "<PHONE>"
-    NAME = "<NAME>"
-    SIN = "<SIN>"
-    STUDENT_ID = "<STUDENT_ID>"
-    ADDRESS = "<ADDRESS>"
+
+def _replace_match(match: "re.Match") -> str:
+    """Return the placeholder for whichever PII class matched."""
+    return _PLACEHOLDERS[match.lastgroup]
 
 
 def scrub_pii(text: str) -> str:
     """
     Scrub all PII from the given text.
 
-    Applies regex patterns to detect and replace personally identifiable
-    information with safe placeholders. Order matters - more specific
-    patterns are applied first.
+    Runs a single combined regex pass: the alternation branches are
+    ordered by specificity (most specific first) and a callable replacer
+    dispatches on the matched group, so the input is scanned once instead
+    of once per PII class. Overlapping classes resolve position-first —
+    see the note on _SCRUB_BRANCHES.
 
     Args:
         text: The input text that may contain PII.
@@ -83,38 +161,37 @@ def scrub_pii(text: str) -> str:
 
     Example:
         >>> scrub_pii("Call John Smith at 555-123-4567")
-        'Call <NAME> at <PHONE>'
+        '<NAME> at <PHONE>'
     """
     if not text:
         return text
 
-    # Apply patterns in order of specificity (most specific first)
-    result = text
-
-    # Email (very specific pattern)
-    result = PIIPattern.EMAIL.sub(PIIPlaceholder.EMAIL, result)
-
-    # Student IDs (with keyword context) - MUST come before SIN
-    result = PIIPattern.STUDENT_ID.sub(PIIPlaceholder.STUDENT_ID, result)
-
-    # SIN (specific format)
-    result = PIIPattern.SIN.sub(PIIPlaceholder.SIN, result)
-
-    # Phone numbers
-    result = PIIPattern.PHONE.sub(PIIPlaceholder.PHONE, result)
+    # Fast path: nothing to scrub without at least one anchor character
+    if _ANCHOR_PATTERN.search(text) is None:
+        return text
 
-    # Addresses
-    result = PIIPattern.ADDRESS.sub(PIIPlaceholder.ADDRESS, result)
+    # subn lets the no-match case return the original object, so callers
+    # can detect "nothing scrubbed" by identity and skip copies
+    result, count = _COMBINED_PATTERN.subn(_replace_match, text)
+    return result if count else text
 
-    # Names (last, as it's the broadest pattern)
-    result = PIIPattern.NAME.sub(PIIPlaceholder.NAME, result)
 
-    return result
+# Separator used to batch string leaves into one scrub call. NUL belongs
+# to none of the patterns' character classes — notably it is NOT \s,
+# unlike the ASCII separator control characters, which Python's Unicode
+# \s does match — so no PII match can cross a leaf boundary through it.
+_LEAF_SEPARATOR = "\x00"
 
 
 def scrub_dict(data: dict[str, Any]) -> dict[str, Any]:
     """
-    Recursively scrub PII from all string values in a dictionary.
+    Scrub PII from all string values in a (possibly nested) dictionary.
+
+    Walks iteratively with an explicit stack, so payload depth is not
+    bounded by the interpreter call stack. All string leaves are gathered
+    during the walk and scrubbed in a single batched call, joined on a
+    separator character no pattern can match across, so the
+    automaton starts once per payload instead of once per leaf.
 
     Args:
         data: Dictionary that may contain PII in string values.
@@ -122,19 +199,53 @@ def scrub_dict(data: dict[str, Any]) -> dict[str, Any]:
     Returns:
         New dictionary with all string values scrubbed.
     """
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            result[key] = scrub_pii(value)
-        elif isinstance(value, dict):
-            result[key] = scrub_dict(value)
-        elif isinstance(value, list):
-            result[key] = [
-                scrub_dict(item) if isinstance(item, dict) else scrub_pii(item) if isinstance(item, str) else item
-                for item in value
-            ]
-        else:
-            result[key] = value
+    result: dict[str, Any] = {}
+    string_slots: list[tuple[Any, Any]] = []  # (destination container, key/index)
+    leaf_values: list[str] = []
+
+    stack: list[tuple[Any, Any]] = [(data, result)]
+    while stack:
+        source, dest = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for key, value in items:
+            if isinstance(value, str):
+                string_slots.append((dest, key))
+                leaf_values.append(value)
+                dest[key] = value
+            elif isinstance(value, dict):
+                child: dict[str, Any] = {}
+                dest[key] = child
+                stack.append((value, child))
+            elif isinstance(value, list):
+                child_list: list[Any] = [None] * len(value)
+                dest[key] = child_list
+                stack.append((value, child_list))
+            else:
+                dest[key] = value
+
+    # No-change fast paths: when nothing was scrubbed the original dict is
+    # returned as-is, sparing the caller a wholesale copy per payload.
+    if not leaf_values:
+        return data
+
+    # A leaf containing the separator itself would corrupt the batch
+    # split; scrub such payloads leaf by leaf instead.
+    if any(_LEAF_SEPARATOR in value for value in leaf_values):
+        scrubbed = [scrub_pii(value) for value in leaf_values]
+        if all(new is old for new, old in zip(scrubbed, leaf_values, strict=True)):
+            return data
+    else:
+        blob = _LEAF_SEPARATOR.join(leaf_values)
+        scrubbed_blob = scrub_pii(blob)
+        if scrubbed_blob is blob:
+            return data
+        scrubbed = scrubbed_blob.split(_LEAF_SEPARATOR)
+
+    # strict: a slot/value count mismatch would mean the separator split
+    # corrupted the batch — fail loudly rather than misassign leaves
+    for (dest, key), value in zip(string_slots, scrubbed, strict=True):
+        dest[key] = value
+
     return result
 
 
@@ -151,16 +262,18 @@ def contains_pii(text: str) -> bool:
     if not text:
         return False
 
-    return any(
-        [
-            PIIPattern.EMAIL.search(text),
-            PIIPattern.PHONE.search(text),
-            PIIPattern.NAME.search(text),
-            PIIPattern.SIN.search(text),
-            PIIPattern.STUDENT_ID.search(text),
-            PIIPattern.ADDRESS.search(text),
-        ]
-    )
+    # Same gating as scrub_pii: the cheap anchor scan short-circuits
+    # clean text, and a single combined search replaces six per-class
+    # automata walks (it stops at the first match of any class).
+    if _ANCHOR_PATTERN.search(text) is None:
+        return False
+
+    return _COMBINED_PATTERN.search(text) is not None
+
+
+# Upper bound on how much request body the middleware inspects for
+# logging; anything beyond is passed through untouched.
+MAX_LOGGED_BODY_BYTES = 16384
 
 
 class PrivacyViolationError(Exception):
@@ -211,6 +324,11 @@ class PrivacyGuardMiddleware(BaseHTTPMiddleware):
         Returns:
             The HTTP response.
         """
+        # Without a log consumer there is nothing to sanitize; skip all
+        # inspection work (notably: never touch the body stream).
+        if self.log_callback is None:
+            return await call_next(request)
+
         # Build sanitized log entry
         sanitized_log = {
             "method": request.method,
@@ -218,32 +336,79 @@ class PrivacyGuardMiddleware(BaseHTTPMiddleware):
             "query_params": scrub_dict(dict(request.query_params)),
         }
 
-        # Read and sanitize body for logging (if present)
-        # Note: Body can only be read once, so we're careful here
+        # Peek a bounded prefix of the body for logging. Large uploads
+        # (offline audio batches) are never fully buffered here; the
+        # consumed messages are replayed so handlers see the full stream.
         if request.method in ("POST", "PUT", "PATCH"):
             try:
-                body = await request.body()
+                body, truncated = await self._peek_body(request)
                 if body:
-                    import json
-
+                    # orjson parses in C; non-JSON bodies (including
+                    # truncated JSON prefixes) fall through to a raw scrub
                     try:
-                        body_json = json.loads(body)
+                        body_json = orjson.loads(body)
+                    except orjson.JSONDecodeError:
+                        body_json = None
+                    if isinstance(body_json, dict):
                         sanitized_log["body"] = scrub_dict(body_json)
-                    except json.JSONDecodeError:
+                    else:
                         sanitized_log["body"] = scrub_pii(body.decode("utf-8", errors="replace"))
+                    if truncated:
+                        sanitized_log["body_truncated"] = True
             except Exception:
                 # If we can't read the body, that's okay for logging purposes
                 sanitized_log["body"] = "<unreadable>"
 
-        # Call the logging callback if provided
-        if self.log_callback:
-            self.log_callback(sanitized_log)
+        self.log_callback(sanitized_log)
 
         # Process the actual request (unmodified)
         response = await call_next(request)
 
         return response
 
+    async def _peek_body(self, request: Request) -> tuple[bytes, bool]:
+        """
+        Read at most MAX_LOGGED_BODY_BYTES of the request body.
+
+        The raw receive messages consumed here are replayed through a
+        replacement receive callable, so downstream handlers still
+        observe the complete stream (classic ASGI replay pattern).
+
+        Returns:
+            (body prefix, whether the body was truncated at the cap).
+        """
+        captured: list[Message] = []
+        size = 0
+        complete = False
+        while size < MAX_LOGGED_BODY_BYTES:
+            message = await request._receive()
+            captured.append(message)
+            if message["type"] != "http.request":
+                # Disconnect: replay it downstream untouched
+                break
+            size += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                complete = True
+                break
+
+        pending = deque(captured)
+        original_receive = request._receive
+
+        async def replay_receive() -> Message:
+            if pending:
+                return pending.popleft()
+            return await original_receive()
+
+        request._receive = replay_receive
+
+        body = b"".join(
+            m.get("body", b"") for m in captured if m["type"] == "http.request"
+        )
+        # Truncated if the stream had more to give, or if a single large
+        # message already exceeded the logging cap.
+        truncated = not complete or len(body) > MAX_LOGGED_BODY_BYTES
+        return body[:MAX_LOGGED_BODY_BYTES], truncated
+
 
 def create_privacy_guard_middleware(
     log_callback: Callable[[dict[str, Any]], None] | None = None,
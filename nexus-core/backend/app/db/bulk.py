@@ -0,0 +1,59 @@
+"""
+Bulk write helpers for high-volume tables.
+
+Per-row ORM inserts pay statement parse/bind/execute overhead for every
+record; for append-only junction rows like outcome_links that cost
+dominates. These helpers drop to asyncpg's binary COPY protocol, which
+streams all records in a single round-trip.
+"""
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.database import engine
+
+logger = logging.getLogger(__name__)
+
+# Columns streamed for each outcome link record, in COPY order.
+OUTCOME_LINK_COLUMNS = ("oracy_session_id", "curriculum_outcome_id", "relevance_score")
+
+
+async def bulk_insert_outcome_links(
+    records: Sequence[tuple[str, str, float | None]],
+) -> int:
+    """
+    Insert outcome link rows via asyncpg binary COPY.
+
+    Args:
+        records: (oracy_session_id, curriculum_outcome_id, relevance_score)
+            tuples. Session/outcome ids must reference existing rows.
+
+    Returns:
+        Number of records written.
+    """
+    if not records:
+        return 0
+
+    async with engine.begin() as conn:
+        await _copy_records(conn, "outcome_links", OUTCOME_LINK_COLUMNS, records)
+
+    logger.debug(f"Bulk-inserted {len(records)} outcome links")
+    return len(records)
+
+
+async def _copy_records(
+    conn: AsyncConnection,
+    table: str,
+    columns: Sequence[str],
+    records: Sequence[tuple],
+) -> None:
+    """Stream records into a table using the driver's COPY support."""
+    raw = await conn.get_raw_connection()
+    # driver_connection is the underlying asyncpg connection.
+    await raw.driver_connection.copy_records_to_table(
+        table,
+        records=records,
+        columns=list(columns),
+    )
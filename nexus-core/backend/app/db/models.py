@@ -8,11 +8,23 @@ CRITICAL: We NEVER store student names. Only student_code (hashed identifier).
 """
 
 import enum
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    Computed,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -190,6 +202,23 @@ class OracySession(Base):
 
     __tablename__ = "oracy_sessions"
 
+    # Composite indexes matching the analytics access paths: period scans
+    # filter on (status, started_at), per-student history scans on
+    # (student_id, started_at). Single-column indexes alone force extra
+    # heap fetches for these queries.
+    __table_args__ = (
+        Index("ix_oracy_sessions_status_started_at", "status", "started_at"),
+        Index("ix_oracy_sessions_student_started_at", "student_id", "started_at"),
+        # Covers the period scans entirely (cutoff range + status filter +
+        # distinct student count) so they run as index-only scans.
+        Index(
+            "ix_oracy_sessions_started_status_student",
+            "started_at",
+            "status",
+            "student_id",
+        ),
+    )
+
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
@@ -245,6 +274,11 @@ class OracySession(Base):
         server_default=func.now(),
         nullable=False,
     )
+    started_on: Mapped[date] = mapped_column(
+        Date,
+        Computed("(started_at AT TIME ZONE 'UTC')::date", persisted=True),
+        comment="UTC calendar day of started_at; lets day-bucketed queries group on an indexed plain column",
+    )
     ended_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
@@ -276,6 +310,15 @@ class ScoutReport(Base):
 
     __tablename__ = "scout_reports"
 
+    # The list endpoint filters on teacher / review state / engagement and
+    # always sorts by created_at DESC; these let each filtered page come
+    # straight off an index instead of a scan + sort.
+    __table_args__ = (
+        Index("ix_scout_reports_teacher_created", "teacher_id", "created_at"),
+        Index("ix_scout_reports_review_created", "is_reviewed", "created_at"),
+        Index("ix_scout_reports_engagement_created", "engagement_level", "created_at"),
+    )
+
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
@@ -302,6 +345,15 @@ class ScoutReport(Base):
         nullable=False,
         default=EngagementLevel.MEDIUM,
     )
+    engagement_score: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "CASE lower(CAST(engagement_level AS TEXT)) "
+            "WHEN 'high' THEN 1.0 WHEN 'medium' THEN 0.5 ELSE 0.0 END",
+            persisted=True,
+        ),
+        comment="Numeric engagement (LOW=0, MEDIUM=0.5, HIGH=1), computed by the database",
+    )
     insight_text: Mapped[str] = mapped_column(
         Text,
         nullable=False,
@@ -359,6 +411,53 @@ class ScoutReport(Base):
         return f"<ScoutReport(id={self.id[:8]}..., engagement={self.engagement_level.value})>"
 
 
+class DailyEngagementStat(Base):
+    """
+    Per-day engagement rollup by student and level.
+
+    Dashboard endpoints aggregate over this table instead of rescanning the
+    oracy_sessions/scout_reports join on every request. Rows are maintained
+    at write time by a scout_reports trigger (see migration 0009), which
+    also backfills from existing data.
+    """
+
+    __tablename__ = "daily_engagement_stats"
+
+    __table_args__ = (
+        Index("ix_daily_engagement_school_date", "school_code", "stat_date"),
+    )
+
+    stat_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    student_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("students.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    engagement_level: Mapped[EngagementLevel] = mapped_column(
+        Enum(EngagementLevel),
+        primary_key=True,
+    )
+    school_code: Mapped[str | None] = mapped_column(
+        String(32),
+        nullable=True,
+        comment="Denormalized from students for school-filtered dashboards",
+    )
+    session_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    duration_sum: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Sum of session durations in seconds for this bucket",
+    )
+
+    def __repr__(self) -> str:
+        return f"<DailyEngagementStat(date={self.stat_date}, level={self.engagement_level.value})>"
+
+
 class CurriculumOutcome(Base):
     """
     Alberta Program of Studies curriculum outcome.
@@ -411,11 +510,13 @@ class CurriculumOutcome(Base):
         comment="Hints for creating cultural analogies",
     )
 
-    # Vector embedding (stored as JSON string for simplicity; use pgvector in production)
+    # Vector embedding. The production schema stores this as pgvector
+    # vector(1536) with an HNSW index (see migration 0005); the ORM keeps a
+    # text mapping for the dev/sqlite path.
     embedding: Mapped[str | None] = mapped_column(
         Text,
         nullable=True,
-        comment="JSON-serialized embedding vector",
+        comment="Embedding vector (pgvector in production)",
     )
 
     def __repr__(self) -> str:
@@ -11,10 +11,11 @@ from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.v1 import router as v1_router
 from app.core.config import settings
-from app.core.database import close_db, init_db
+from app.core.database import close_db, init_db, warm_pool
 from app.core.privacy_guard import create_privacy_guard_middleware, scrub_pii
 
 # Configure logging
@@ -52,6 +53,9 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database initialized")
 
+    # Fill the connection pool before the first traffic burst
+    await warm_pool()
+
     yield
 
     # Shutdown
@@ -73,15 +77,18 @@ app = FastAPI(
 
 # === Middleware ===
 
-# CORS middleware
+# CORS middleware (frozenset: O(1) origin membership per preflight)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.allowed_origins,
+    allow_origins=settings.allowed_origins_set,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (analytics trend/coverage payloads)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Privacy Guard middleware (logs sanitized data only)
 PrivacyGuardMiddleware = create_privacy_guard_middleware(
     log_callback=privacy_log_callback if settings.debug else None
@@ -141,9 +148,24 @@ async def global_exception_handler(request, exc: Exception) -> dict[str, str]:
 if __name__ == "__main__":
     import uvicorn
 
+    # uvloop ships with uvicorn[standard]; request it explicitly so a
+    # missing wheel shows up as a startup error instead of a silent
+    # fallback to the slower stdlib loop on the websocket audio path.
+    # An io_uring-backed transport for the audio stream was evaluated and
+    # rejected: neither asyncio nor uvloop exposes submission-queue hooks,
+    # so it would mean replacing the ASGI server's socket layer wholesale;
+    # uvloop's epoll path is the supported C implementation here.
+    try:
+        import uvloop  # noqa: F401
+
+        loop_impl = "uvloop"
+    except ImportError:  # pragma: no cover - platform without uvloop wheels
+        loop_impl = "auto"
+
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
         reload=not settings.is_production,
+        loop=loop_impl,
     )
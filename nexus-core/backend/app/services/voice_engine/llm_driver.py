@@ -104,6 +104,26 @@ class LLMDriver(ABC):
         """Convert text to speech audio."""
         pass
 
+    async def generate_audio_and_transcript(
+        self,
+        user_audio: bytes,
+        context: SessionContext,
+    ) -> AsyncGenerator[tuple[str, str | bytes], None]:
+        """
+        Yield ("transcript", text) and ("audio", chunk) items for one turn.
+
+        Default implementation composes transcribe_audio and
+        generate_audio_response sequentially. Drivers whose backend emits
+        transcript and audio in a single stream should override this so
+        the same audio is not processed twice.
+        """
+        transcript = await self.transcribe_audio(user_audio)
+        if transcript:
+            yield ("transcript", transcript)
+        async for chunk in self.generate_audio_response(user_audio, context):
+            if chunk:
+                yield ("audio", chunk)
+
 
 class MockLLMDriver(LLMDriver):
     """
@@ -237,15 +257,27 @@ class OpenAIRealtimeDriver(LLMDriver):
         user_audio: bytes,
         context: SessionContext,
     ) -> AsyncGenerator[bytes, None]:
+        """Generate audio response using OpenAI Realtime API (audio only)."""
+        async for kind, chunk in self.generate_audio_and_transcript(user_audio, context):
+            if kind == "audio":
+                yield chunk  # type: ignore[misc]
+
+    async def generate_audio_and_transcript(
+        self,
+        user_audio: bytes,
+        context: SessionContext,
+    ) -> AsyncGenerator[tuple[str, str | bytes], None]:
         """
-        Generate audio response using OpenAI Realtime API.
+        Stream transcript and audio for one turn over a single Realtime
+        API session.
 
-        Uses WebSocket connection to OpenAI's Realtime API for
-        bidirectional audio streaming with GPT-4o.
+        The realtime session already runs whisper transcription on the
+        input buffer, so the transcript arrives as an event of the same
+        stream — no separate ASR round-trip over the same audio.
         """
         if not self._api_key:
             logger.warning("OpenAI API key not configured for audio")
-            yield b""
+            yield ("audio", b"")
             return
 
         import base64
@@ -304,7 +336,7 @@ class OpenAIRealtimeDriver(LLMDriver):
                 # Request a response
                 await ws.send(json.dumps({"type": "response.create"}))
 
-                # Receive and yield audio chunks
+                # Receive and yield transcript/audio items
                 async for message in ws:
                     try:
                         event = json.loads(message)
@@ -314,7 +346,14 @@ class OpenAIRealtimeDriver(LLMDriver):
                             # Decode and yield audio chunk
                             audio_chunk = base64.b64decode(event.get("delta", ""))
                             if audio_chunk:
-                                yield audio_chunk
+                                yield ("audio", audio_chunk)
+
+                        elif event_type == (
+                            "conversation.item.input_audio_transcription.completed"
+                        ):
+                            transcript = event.get("transcript", "")
+                            if transcript:
+                                yield ("transcript", transcript)
 
                         elif event_type == "response.audio.done":
                             # Audio response complete
@@ -336,11 +375,11 @@ class OpenAIRealtimeDriver(LLMDriver):
 
         except websockets.exceptions.WebSocketException as e:
             logger.error(f"WebSocket connection error: {e}")
-            yield b""
+            yield ("audio", b"")
 
         except Exception as e:
             logger.error(f"OpenAI Realtime API error: {e}")
-            yield b""
+            yield ("audio", b"")
 
     async def transcribe_audio(self, audio: bytes) -> str:
         """
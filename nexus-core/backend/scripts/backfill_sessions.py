@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Backfill Oracy Sessions Script
+
+Bulk-loads historical oracy session records (session replay, district
+imports) into the database. Maintaining btree indexes row-by-row dominates
+bulk load time, so the load runs as: drop non-essential indexes -> stream
+rows via asyncpg binary COPY -> recreate indexes CONCURRENTLY.
+
+Input is a JSON array of session records using the oracy_sessions column
+names; timestamps are ISO-8601 strings.
+
+Usage:
+    poetry run python scripts/backfill_sessions.py sessions.json
+"""
+
+import asyncio
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import asyncpg
+
+# Allow standalone script usage from the backend directory
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+# COPY column order for oracy_sessions.
+SESSION_COLUMNS = (
+    "id",
+    "student_id",
+    "status",
+    "duration_seconds",
+    "turn_count",
+    "transcript_summary",
+    "curriculum_outcome_ids",
+    "avg_response_latency_ms",
+    "started_at",
+    "ended_at",
+)
+
+async def fetch_nonessential_indexes(conn: "asyncpg.Connection") -> dict[str, str]:
+    """
+    Enumerate the droppable oracy_sessions indexes at runtime.
+
+    Everything except the primary key is dropped for the load and rebuilt
+    afterwards (the PK stays: COPY still needs uniqueness enforcement).
+    Reading pg_indexes keeps the set in lockstep with the migrations — a
+    static list here went stale the moment later migrations added the
+    seq_id unique index, the GIN expression index, the covering index and
+    started_on.
+
+    Returns:
+        Mapping of index name to its CONCURRENTLY-rebuilding definition.
+    """
+    rows = await conn.fetch(
+        "SELECT indexname, indexdef FROM pg_indexes "
+        "WHERE schemaname = current_schema() "
+        "AND tablename = 'oracy_sessions' "
+        "AND indexname <> 'oracy_sessions_pkey'"
+    )
+    indexes: dict[str, str] = {}
+    for row in rows:
+        definition = row["indexdef"]
+        # Rebuilds must not block writes
+        if definition.startswith("CREATE UNIQUE INDEX "):
+            definition = definition.replace(
+                "CREATE UNIQUE INDEX ", "CREATE UNIQUE INDEX CONCURRENTLY ", 1
+            )
+        elif definition.startswith("CREATE INDEX "):
+            definition = definition.replace(
+                "CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1
+            )
+        indexes[row["indexname"]] = definition
+    return indexes
+
+
+def _dsn() -> str:
+    """Database DSN in plain libpq form (asyncpg connects directly)."""
+    return str(settings.database_url).replace("postgresql+asyncpg://", "postgresql://")
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse an ISO-8601 timestamp, tolerating a trailing Z."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def load_records(json_path: Path) -> list[tuple]:
+    """Load session records from JSON into COPY-ordered tuples."""
+    with open(json_path, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    records = []
+    for row in raw:
+        records.append((
+            row["id"],
+            row["student_id"],
+            row.get("status", "completed"),
+            row.get("duration_seconds"),
+            row.get("turn_count", 0),
+            row.get("transcript_summary"),
+            row.get("curriculum_outcome_ids"),
+            row.get("avg_response_latency_ms"),
+            _parse_timestamp(row.get("started_at")),
+            _parse_timestamp(row.get("ended_at")),
+        ))
+    return records
+
+
+async def _recreate_index(name: str, create_sql: str) -> None:
+    """Rebuild one index on its own connection (CONCURRENTLY cannot share)."""
+    conn = await asyncpg.connect(_dsn())
+    try:
+        logger.info(f"Recreating index {name}...")
+        await conn.execute(create_sql)
+    finally:
+        await conn.close()
+
+
+async def _recreate_indexes(indexes: dict[str, str]) -> None:
+    """Rebuild all captured indexes concurrently."""
+    await asyncio.gather(
+        *(_recreate_index(name, sql) for name, sql in indexes.items())
+    )
+
+
+def _dump_index_definitions(indexes: dict[str, str]) -> Path:
+    """
+    Persist the captured index definitions next to the script.
+
+    Written before any failure-path rebuild is attempted, so even if the
+    rebuild itself fails the operator has the exact CREATE INDEX
+    statements rather than log lines to reconstruct from.
+    """
+    rescue_path = Path("oracy_sessions_indexes.rescue.sql")
+    rescue_path.write_text(";\n".join(indexes.values()) + ";\n", encoding="utf-8")
+    return rescue_path
+
+
+async def backfill(json_path: Path) -> int:
+    """Run the backfill: drop indexes, COPY records, rebuild indexes."""
+    records = load_records(json_path)
+    if not records:
+        logger.warning("No records to load")
+        return 0
+
+    conn = await asyncpg.connect(_dsn())
+    try:
+        # Session-scoped load tuning: skip FK trigger checks for replayed
+        # data, don't wait on WAL flush per commit, and give index builds
+        # room to sort in memory.
+        await conn.execute("SET session_replication_role = replica")
+        await conn.execute("SET synchronous_commit = off")
+        await conn.execute("SET maintenance_work_mem = '1GB'")
+
+        nonessential_indexes = await fetch_nonessential_indexes(conn)
+        for name in nonessential_indexes:
+            logger.info(f"Dropping index {name}...")
+            await conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+        logger.info(f"Copying {len(records)} session records...")
+        try:
+            await conn.copy_records_to_table(
+                "oracy_sessions",
+                records=records,
+                columns=list(SESSION_COLUMNS),
+            )
+        except Exception:
+            # The indexes are already dropped: dump their definitions to
+            # disk, then rebuild before surfacing the failure, so a bad
+            # load cannot leave the table unindexed.
+            rescue_path = _dump_index_definitions(nonessential_indexes)
+            logger.error(
+                f"COPY failed with indexes dropped; definitions saved to "
+                f"{rescue_path}, attempting rebuild before re-raising"
+            )
+            await _recreate_indexes(nonessential_indexes)
+            rescue_path.unlink()
+            logger.info("Indexes rebuilt after failed COPY")
+            raise
+
+        await conn.execute("SET session_replication_role = origin")
+    finally:
+        await conn.close()
+
+    # Rebuild concurrently, each on its own connection.
+    await _recreate_indexes(nonessential_indexes)
+
+    logger.info(f"Backfilled {len(records)} sessions")
+    return len(records)
+
+
+def main() -> None:
+    """Entry point."""
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(1)
+
+    json_path = Path(sys.argv[1])
+    if not json_path.exists():
+        logger.error(f"Input file not found: {json_path}")
+        sys.exit(1)
+
+    asyncio.run(backfill(json_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Tests for the keyset pagination cursor codec.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.api.pagination import decode_cursor, encode_cursor
+
+
+class TestCursorCodec:
+    """Tests for encode_cursor / decode_cursor."""
+
+    def test_roundtrip(self) -> None:
+        """A cursor decodes back to the boundary it encoded."""
+        boundary = datetime(2025, 3, 14, 9, 26, tzinfo=UTC)
+        cursor = encode_cursor(boundary, "row-id-123")
+        assert decode_cursor(cursor) == (boundary, "row-id-123")
+
+    def test_cursor_is_opaque_ascii(self) -> None:
+        """Cursors are URL-safe strings a client can pass back verbatim."""
+        cursor = encode_cursor(datetime(2025, 1, 1, tzinfo=UTC), "abc")
+        assert cursor.isascii()
+        assert "+" not in cursor and "/" not in cursor
+
+    def test_malformed_base64_raises_value_error(self) -> None:
+        """Garbage input surfaces as ValueError, not a raw codec error."""
+        with pytest.raises(ValueError):
+            decode_cursor("!!!not-base64!!!")
+
+    def test_valid_base64_wrong_payload_raises_value_error(self) -> None:
+        """Well-formed base64 wrapping the wrong JSON shape is rejected."""
+        import base64
+
+        not_a_pair = base64.urlsafe_b64encode(b'{"nope": 1}').decode()
+        with pytest.raises(ValueError):
+            decode_cursor(not_a_pair)
+
+        bad_timestamp = base64.urlsafe_b64encode(b'["not-a-date", "id"]').decode()
+        with pytest.raises(ValueError):
+            decode_cursor(bad_timestamp)
+
+    def test_empty_cursor_raises_value_error(self) -> None:
+        """An empty string is an invalid cursor."""
+        with pytest.raises(ValueError):
+            decode_cursor("")
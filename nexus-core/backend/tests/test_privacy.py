@@ -206,3 +206,72 @@ class TestRealWorldScenarios:
         # Should remain unchanged (no PII)
         assert "SS-5-1-2" in result
         assert "Students will examine" in result
+
+
+class TestScrubDictBatching:
+    """Tests for scrub_dict's batched-leaf scrubbing internals."""
+
+    def test_separator_collision_falls_back_to_per_leaf(self) -> None:
+        """Leaves containing the batch separator are still scrubbed."""
+        data = {
+            "weird": "before\x00after",
+            "email": "jane@example.com",
+        }
+        result = scrub_dict(data)
+        assert result["weird"] == "before\x00after"
+        assert result["email"] == PIIPlaceholder.EMAIL
+
+    def test_no_change_returns_original_dict(self) -> None:
+        """A payload with nothing to scrub comes back as the same object."""
+        data = {"note": "all clean here", "nested": {"more": "still clean"}}
+        assert scrub_dict(data) is data
+
+    def test_changed_payload_is_a_new_dict(self) -> None:
+        """Scrubbing must never mutate the caller's payload."""
+        data = {"email": "jane@example.com"}
+        result = scrub_dict(data)
+        assert result is not data
+        assert data["email"] == "jane@example.com"
+        assert result["email"] == PIIPlaceholder.EMAIL
+
+    def test_no_change_returns_original_string(self) -> None:
+        """scrub_pii hands back the same object when nothing matched."""
+        text = "Number 12 is fine and nothing here is PII"
+        assert scrub_pii(text) is text
+
+    def test_nested_lists_are_scrubbed(self) -> None:
+        """Lists nested inside lists are traversed too."""
+        data = {"rows": [["jane@example.com", "clean"], [7]]}
+        result = scrub_dict(data)
+        assert result["rows"][0] == [PIIPlaceholder.EMAIL, "clean"]
+        assert result["rows"][1] == [7]
+
+
+class TestOverlapPrecedence:
+    """Pin how the single-pass scrubber resolves overlapping PII classes."""
+
+    def test_leftmost_match_wins_on_overlap(self) -> None:
+        """Position-first resolution: the earliest-starting class claims
+        the overlap.
+
+        The pre-combined sequential passes were class-first (EMAIL ran
+        before NAME), so "John Smith@x.com" used to become
+        "John <EMAIL>". The single alternation resolves position-first,
+        and the NAME starting earlier absorbs "Smith". Either way the
+        PII is fully removed; this pins the chosen boundary so any
+        change to it is deliberate.
+        """
+        assert scrub_pii("John Smith@x.com") == "<NAME>@x.com"
+
+    def test_leading_capitalized_word_joins_name(self) -> None:
+        """A capitalized word before a name is absorbed into the NAME
+        match (longstanding behavior of the broad NAME pattern)."""
+        assert scrub_pii("Call John Smith at 555-123-4567") == "<NAME> at <PHONE>"
+
+    def test_non_overlapping_classes_all_scrubbed(self) -> None:
+        """Disjoint PII classes in one string each get their own placeholder."""
+        result = scrub_pii("jane@x.com then 123-456-789 then 456 Oak Avenue")
+        assert result == (
+            f"{PIIPlaceholder.EMAIL} then {PIIPlaceholder.SIN} "
+            f"then {PIIPlaceholder.ADDRESS}"
+        )
@@ -9,6 +9,10 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 
 from app.api.v1.websockets.voice_stream import (
+    AudioRing,
+    EnergyVAD,
+    VAD_FRAME_BYTES,
+    VAD_TRAILING_SILENCE_FRAMES,
     VoiceStreamManager,
     SessionState,
     MessageType,
@@ -76,9 +80,8 @@ class TestVoiceStreamManager:
         updated = await manager.get_session(session.session_id)
         assert updated is not None
         assert updated.turn_count == 2
-        assert len(updated.latencies) == 2
-        assert updated.latencies[0] == 150.0
-        assert updated.latencies[1] == 200.0
+        assert updated.latency_count == 2
+        assert updated.latency_mean == pytest.approx(175.0)
 
     @pytest.mark.asyncio
     async def test_add_conversation_turn(self, manager: VoiceStreamManager, mock_websocket: AsyncMock) -> None:
@@ -145,7 +148,7 @@ class TestSessionState:
         assert state.curriculum_outcome is None
         assert state.turn_count == 0
         assert state.is_active is True
-        assert len(state.latencies) == 0
+        assert state.latency_count == 0
         assert len(state.conversation_history) == 0
 
     def test_session_state_with_context(self) -> None:
@@ -224,3 +227,84 @@ class TestMessageTypes:
         assert MessageType.SESSION_ENDED.value == "session_ended"
         assert MessageType.ERROR.value == "error"
         assert MessageType.LATENCY_UPDATE.value == "latency_update"
+
+
+class TestAudioRing:
+    """Tests for the per-session audio ring buffer."""
+
+    def test_append_and_drain_roundtrip(self) -> None:
+        """Appended chunks come back concatenated, and draining empties."""
+        ring = AudioRing()
+        ring.append(b"abc")
+        ring.append(b"def")
+        assert len(ring) == 6
+        assert bytes(ring.drain()) == b"abcdef"
+        assert len(ring) == 0
+        assert ring.drain() == b""
+
+    def test_wraparound_across_buffer_boundary(self) -> None:
+        """Writes that wrap the physical buffer are linearized on drain."""
+        ring = AudioRing()
+        ring.append(b"x" * (AudioRing.SIZE - 3))
+        ring.drain()
+        ring.append(b"1234567890")
+        assert bytes(ring.drain()) == b"1234567890"
+
+    def test_overflow_keeps_most_recent_audio(self) -> None:
+        """When full, the oldest audio is dropped, never the newest."""
+        ring = AudioRing()
+        big = bytes(range(256)) * ((AudioRing.SIZE // 256) + 10)
+        ring.append(big)
+        assert bytes(ring.drain()) == big[-AudioRing.SIZE:]
+
+    def test_drained_view_survives_next_append(self) -> None:
+        """The zero-copy drain view must not be clobbered by new writes."""
+        ring = AudioRing()
+        ring.append(b"hello")
+        view = ring.drain()
+        ring.append(b"world")
+        assert bytes(view) == b"hello"
+        assert bytes(ring.drain()) == b"world"
+
+
+class TestEnergyVAD:
+    """Tests for the energy-based end-of-utterance detector."""
+
+    @staticmethod
+    def _frame(amplitude: int) -> bytes:
+        samples = VAD_FRAME_BYTES // 2
+        return amplitude.to_bytes(2, "little", signed=True) * samples
+
+    def test_utterance_ends_after_trailing_silence(self) -> None:
+        """Speech followed by enough silence ends the utterance."""
+        vad = EnergyVAD()
+        vad.feed(self._frame(2000) * 10)
+        assert not vad.utterance_ended
+        vad.feed(self._frame(0) * VAD_TRAILING_SILENCE_FRAMES)
+        assert vad.utterance_ended
+
+    def test_silence_alone_never_triggers(self) -> None:
+        """Pure silence is not an utterance."""
+        vad = EnergyVAD()
+        vad.feed(self._frame(0) * (VAD_TRAILING_SILENCE_FRAMES * 2))
+        assert not vad.utterance_ended
+
+    def test_speech_resets_the_silence_run(self) -> None:
+        """Speech in the middle of a pause restarts the countdown."""
+        vad = EnergyVAD()
+        vad.feed(self._frame(2000) * 2)
+        vad.feed(self._frame(0) * (VAD_TRAILING_SILENCE_FRAMES - 1))
+        vad.feed(self._frame(2000))
+        vad.feed(self._frame(0) * (VAD_TRAILING_SILENCE_FRAMES - 1))
+        assert not vad.utterance_ended
+        vad.feed(self._frame(0))
+        assert vad.utterance_ended
+
+    def test_reset_starts_a_fresh_utterance(self) -> None:
+        """reset() clears both speech and silence tracking."""
+        vad = EnergyVAD()
+        vad.feed(self._frame(2000) * 2)
+        vad.feed(self._frame(0) * VAD_TRAILING_SILENCE_FRAMES)
+        assert vad.utterance_ended
+        vad.reset()
+        assert not vad.utterance_ended